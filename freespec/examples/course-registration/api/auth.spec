@@ -33,3 +33,4 @@ tests:
 - GET /auth/me with valid token returns 200 and student data
 - GET /auth/me without authentication returns 401
 - GET /auth/me with expired token returns 401
+- GET /auth/me with an Authorization header that is not a Bearer token returns 401
@@ -3,7 +3,7 @@
 description:
 The courses API provides REST endpoints for managing @entities/course records. Reading courses is available to all authenticated users via @services/auth, but modifications require admin privileges.
 
-GET /courses lists all courses. Supports optional query parameters for filtering by open status and pagination. Returns 200 with an array of course data including current enrollment count and available seats.
+GET /courses lists all courses. Supports optional query parameters for filtering by open status and pagination. Returns 200 with an array of course data including current enrollment count and available seats. Pagination uses page and limit query parameters with sensible defaults, and the response includes pagination metadata. The response carries an ETag derived from the catalog version of @entities/course, which changes whenever any course changes, including seats reserved and released by enrollments; when the request's If-None-Match header matches the current ETag, the endpoint returns 304 with an empty body without building the course list.
 
 GET /courses/:id retrieves a specific course with full details including prerequisites. Returns 200 with course data or 404 if not found.
 
@@ -30,6 +30,9 @@ tests:
 - GET /courses without authentication returns 401
 - GET /courses returns 200 with course list and enrollment info
 - GET /courses can filter by open status
+- GET /courses respects pagination parameters
+- GET /courses with a matching If-None-Match returns 304 with no body
+- GET /courses after a course changes returns 200 with a new ETag
 - GET /courses/:id returns 200 with full course details
 - GET /courses/:id for non-existent course returns 404
 - POST /courses without admin returns 403
@@ -3,9 +3,11 @@
 description:
 The registrations API provides REST endpoints for course registration, using @services/enrollment for the business logic.
 
-POST /registrations enrolls the authenticated student in a course. The request body contains the course ID. Returns 201 with the registration data, 400 if prerequisites not met or already enrolled, 404 if course not found, or 409 if course is full or closed.
+POST /registrations enrolls the authenticated student in a course. The request body contains the course ID. Returns 201 with the registration data, 400 if prerequisites not met or already enrolled, 404 if course not found, 409 if course is full or closed, or 429 if the student is sending requests too quickly.
 
-GET /registrations lists the authenticated student's registrations. Supports filtering by status with a query parameter. Returns 200 with an array of registration data including course information.
+Registration traffic arrives in bursts when a semester opens, so POST /registrations is throttled per student with a token bucket: each student may make a short burst of requests (10 by default) and then one request per second as tokens refill. Rejected requests do not consume a token and do not touch the course.
+
+GET /registrations lists the authenticated student's registrations. Supports filtering by status with a query parameter. Returns 200 with an array of registration data including course information. The course code and title for every listed registration are fetched together with one batch lookup from @entities/course rather than one lookup per registration; the same applies to GET /students/:id/registrations.
 
 GET /registrations/:id retrieves a specific registration. Students can only access their own registrations; admins can access any. Returns 200 with registration data, 403 if not authorized, or 404 if not found.
 
@@ -30,6 +32,9 @@ tests:
 - POST /registrations for full course returns 409
 - POST /registrations without prerequisites met returns 400
 - POST /registrations for already enrolled course returns 400
+- POST /registrations beyond the burst allowance returns 429
+- POST /registrations succeeds again once tokens have refilled
+- POST /registrations throttling for one student does not affect another student
 - GET /registrations returns own registrations
 - GET /registrations can filter by status
 - GET /registrations/:id for own registration returns 200
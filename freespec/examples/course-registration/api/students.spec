@@ -11,7 +11,7 @@ PATCH /students/:id updates a student's information. Students can update their o
 
 DELETE /students/:id deactivates a student. Requires admin privileges. This does not delete the student but marks them as inactive. Returns 204 on success, 403 if not admin, or 404 if not found.
 
-Pagination uses page and limit query parameters with sensible defaults. The response includes pagination metadata.
+Pagination uses page and limit query parameters with sensible defaults. The response includes pagination metadata. GET /students also returns an ETag derived from the student directory version of @entities/student, so it changes whenever any student changes; a request whose If-None-Match header matches it receives 304 with an empty body.
 
 exports:
 - GET /students to list all students
@@ -24,6 +24,8 @@ tests:
 - GET /students without admin privileges returns 403
 - GET /students as admin returns 200 with student list
 - GET /students respects pagination parameters
+- GET /students with a matching If-None-Match returns 304 with no body
+- GET /students after a student changes returns 200 with a new ETag
 - GET /students/:id as the same student returns 200
 - GET /students/:id as a different non-admin student returns 403
 - GET /students/:id as admin returns 200
@@ -3,22 +3,36 @@
 description:
 A course represents a class that students can register for. Each course has a unique code like "CS101" that identifies it, a title for display, and an optional description.
 
-Courses have a maximum capacity indicating how many students can enroll. A course can be open for registration or closed. Only open courses accept new registrations. Courses start as closed when created.
+Courses are looked up by ID and by code on nearly every request, so both lookups take constant time no matter how many courses exist, and the uniqueness check when creating a course uses the same code index rather than scanning existing courses.
 
-Courses may have prerequisites, which are other courses a student must have completed before registering. Prerequisites form a directed acyclic graph; circular prerequisites are not allowed.
+Every course carries a version number that starts at 1 and increases by one with each change to the course, including seat reservations and releases. An update may name the version it expects; if the course has changed since then, the update fails without applying anything so the caller can re-read and retry. This lets concurrent writers coordinate without holding locks on the course. The catalog as a whole also has a version number, which increases whenever any course is created or changes in any way, including seat reservations and releases, so a course listing built at one catalog version stays accurate, seat counts included, for as long as that version is unchanged.
+
+Courses have a maximum capacity indicating how many students can enroll. A course can be open for registration or closed. Only open courses accept new registrations. Courses start as closed when created. Courses are indexed by their open status, so listing only open or only closed courses visits just the courses in that state rather than filtering the whole catalog.
+
+Each course keeps a running count of its current enrollments. The count goes up when a seat is reserved and down when a seat is released, so reading the enrollment count or the number of available seats never requires scanning registrations. Reserving a seat is a single atomic step: it succeeds and increments the count only if the course is open and below capacity at that moment, and otherwise fails saying whether the course was closed or full. No separate read of the seat count precedes it, so concurrent reservations can never take more seats than the capacity.
+
+Courses may have prerequisites, which are other courses a student must have completed before registering. Prerequisites form a directed acyclic graph; circular prerequisites are not allowed. To keep the cycle check cheap, each course remembers which courses are reachable from it through prerequisite chains. Adding an edge is rejected when the new prerequisite can already reach the course, and the remembered reachability is updated when prerequisites are added or removed rather than recomputed from scratch on every check. Prerequisite chains can be arbitrarily long, so any walk over the graph must be iterative, visit each course at most once, and stop as soon as the answer is known.
+
+A course can report its full set of prerequisites, direct and indirect. This is the same reachability the course remembers for the cycle check, so it is read from that structure rather than kept in a second cache, and the two can never disagree. Adding or removing a prerequisite changes the reachability of that course and of every course that depends on it, directly or indirectly. To find those courses without scanning the catalog, each course also knows which courses list it as a direct prerequisite, kept up to date as prerequisites are added and removed.
 
 exports:
 - Create a new course with code, title, capacity, and optional description
 - Find a course by its code
 - Find a course by its unique ID
+- Find several courses by their IDs in a single call
 - Update a course's title, description, or capacity
 - Open a course for registration
 - Close a course to registration
 - Add a prerequisite to a course
 - Remove a prerequisite from a course
+- Get all direct and indirect prerequisites of a course
+- List the courses that directly require a course as a prerequisite
 - List all courses with optional filters for open status
+- Reserve a seat in a course
+- Release a seat in a course
 - Get the current enrollment count for a course
 - Check if a course has available seats
+- Get the catalog version number
 
 tests:
 - Creating a course with valid code, title, and capacity succeeds
@@ -27,7 +41,28 @@ tests:
 - Creating a course with capacity less than 1 fails
 - Opening a closed course succeeds
 - Opening an already open course succeeds without error
+- Listing open courses returns exactly the courses that are currently open
+- A course that is opened and then closed appears only in the closed listing
 - Adding a prerequisite that would create a cycle fails
 - Adding the same prerequisite twice succeeds without creating duplicates
+- Adding a prerequisite that would create an indirect cycle through several courses fails
+- After removing a prerequisite, an edge that previously would have created a cycle can be added
+- All prerequisites of a course include the prerequisites of its prerequisites
+- All prerequisites of a course reflect a prerequisite added further up the chain
+- All prerequisites of a course no longer include a prerequisite removed further up the chain
+- Listing courses that require a course reflects prerequisites added and removed
+- In a chain of 10,000 courses, each the prerequisite of the next, closing the chain into a cycle fails without exceeding any recursion limit
 - Removing a prerequisite that doesn't exist succeeds without error
+- Finding several courses by ID returns each existing course keyed by its ID and omits unknown IDs
 - Reducing capacity below current enrollment count fails
+- Each change to a course increases its version by one
+- Updating a course with the current expected version succeeds
+- Updating a course with a stale expected version fails and leaves the course unchanged
+- The catalog version increases when a course is created, updated, opened, closed, or has its prerequisites changed
+- The catalog version increases when a seat is reserved or released
+- The catalog version is unchanged by lookups and listings
+- Reserving a seat increases the enrollment count and decreases available seats by one
+- Releasing a seat decreases the enrollment count and increases available seats by one
+- Reserving a seat in a full course fails and leaves the count unchanged
+- Reserving a seat in a closed course fails as closed and leaves the count unchanged
+- Many concurrent reservations on a course with one seat left result in exactly one success
@@ -1,30 +1,61 @@
 # registration.spec
 
 description:
-A registration links a @entities/student to a @entities/course, representing enrollment. Each registration tracks when the student enrolled and their current status.
+A registration links a @entities/student to a @entities/course, representing enrollment. Each registration tracks when the student enrolled, their current status, and when that status last changed. Because a registration can reach at most one terminal status, the completion time of a completed registration and the drop time of a dropped registration are both that single status-change time; there are no separate completion and drop timestamps.
 
-A registration can be enrolled, completed, or dropped. Students start as enrolled when they register. A completed registration means the student finished the course successfully. A dropped registration means the student withdrew.
+A registration can be enrolled, completed, or dropped. Students start as enrolled when they register. The only allowed status changes are from enrolled to completed and from enrolled to dropped; every other change, including any change out of completed or dropped, is rejected. A completed registration means the student finished the course successfully. A dropped registration means the student withdrew.
 
-A student can only have one active registration per course. If they drop a course, they can register again. Completed registrations count toward prerequisite requirements for other courses.
+A student can only have one active registration per course. Creating a registration checks for an existing active registration and records the new one as a single atomic step, so two concurrent attempts for the same student and course produce exactly one registration and the other attempt fails as a duplicate. If they drop a course, they can register again. Completed registrations count toward prerequisite requirements for other courses.
+
+Registrations are indexed by student, by course, and by the student and course pair, which always points at the pair's most recent registration. Finding a registration by student and course, checking whether a student completed a course, and the duplicate check when creating a registration are each a single keyed lookup rather than a scan. Each student's registrations are also grouped by status, and a registration moves between groups when it is completed or dropped, so finding a student's active enrollments returns that group directly without filtering the student's full history.
+
+Each student also has a registration version number, which starts at zero and increases whenever one of the student's registrations is created or changes status. Comparing it with a version seen earlier tells whether any of that student's registrations has been added, completed, or dropped since, without reading the registrations themselves.
+
+A student's registrations can also be read one chunk at a time in enrollment order, for histories too long to hold at once. Each chunk is fetched only when the caller asks for it, so the memory used depends on the chunk size rather than on the length of the history.
+
+Registrations can also be created in bulk from a list of student and course pairs, for seeding and for busy enrollment days. A bulk create looks up each distinct student and course only once, applies the same checks as a single create to every pair, and reports for each pair whether it succeeded or why it failed.
 
 exports:
 - Create a registration for a student in a course
+- Create registrations for many student and course pairs at once
 - Find a registration by student and course
 - Find all registrations for a student
+- Read a student's registrations in chunks of a given size
+- Find a student's active enrollments
+- Find a student's registrations together with their courses, optionally filtered by status
 - Find all registrations for a course
 - Mark a registration as completed
 - Mark a registration as dropped
 - Check if a student has completed a specific course
+- Find which of a set of courses a student has completed
+- Get a student's registration version number
 
 tests:
 - Creating a registration for a valid student and course succeeds
 - Creating a registration for a non-existent student fails
 - Creating a registration for a non-existent course fails
 - Creating a duplicate active registration for same student and course fails
+- Concurrent attempts to register the same student for the same course create exactly one registration
 - A student who dropped a course can register for it again
 - A student who completed a course cannot register for it again
 - Marking an enrolled registration as completed succeeds
+- A completed registration reports its completion time and no drop time
+- A dropped registration reports its drop time and no completion time
 - Marking a dropped registration as completed fails
 - Marking a completed registration as dropped fails
+- Marking a dropped registration as dropped again fails
 - Finding registrations for a student returns all statuses
+- Reading a student's registrations in chunks returns every registration exactly once in enrollment order
+- Reading a student's registrations in chunks fetches a chunk only when the previous one has been consumed
+- Finding a student's active enrollments returns only enrolled registrations
+- A registration that is dropped no longer appears among the student's active enrollments
 - Checking completion returns true only for completed status
+- Finding a student's registrations with their courses pairs each registration with its own course
+- Finding a student's registrations with their courses filtered to enrolled returns only active enrollments
+- Finding completed courses among a set returns only those the student completed, ignoring enrolled and dropped ones
+- Creating registrations in bulk creates one registration per valid pair
+- Creating registrations in bulk reports failures for invalid pairs without affecting valid ones
+- Creating registrations in bulk with the same pair twice creates only one active registration
+- A student's registration version increases when a registration is created, completed, or dropped
+- A student's registration version is unchanged by another student's registrations
+- Finding by student and course after a drop and re-registration returns the new registration
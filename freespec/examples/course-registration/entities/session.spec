@@ -3,9 +3,11 @@
 description:
 A session represents an authenticated login for a @entities/student. When a student successfully logs in, a session is created with a unique token they use for subsequent requests.
 
-Sessions have an expiration time, after which they are no longer valid. The default session duration is 24 hours. Sessions can also be explicitly invalidated when the student logs out.
+Sessions have an expiration time, after which they are no longer valid. The default session duration is 24 hours. Sessions can also be explicitly invalidated when the student logs out. Components that remember anything about a session, such as resolved tokens, can register a listener: every invalidation, of one session or of all a student's sessions, and every extension reports the affected tokens to the listeners before it returns.
 
-Each session token is a cryptographically random string that cannot be guessed. Tokens are unique across all sessions.
+Every authenticated request looks up its session by token, so sessions are indexed by token and by student. Finding, validating, invalidating, and extending a session by token are single keyed lookups, and validity is decided by reading the clock once. Expired sessions are removed lazily in expiry order, so cleanup never scans sessions that are still live. Because extending a session moves its expiry later, cleanup re-checks a session's current expiration time before removing it; a session whose expiry has moved is requeued at its new expiry instead of being removed.
+
+Each session token is a cryptographically random string that cannot be guessed: 256 bits of randomness encoded as URL-safe base64 text, which is shorter to store, hash, and compare than hexadecimal. Tokens are unique across all sessions. Wherever tokens are kept for lookup, the index key is a SHA-256 digest of the token rather than the token itself.
 
 exports:
 - Create a new session for a student
@@ -14,15 +16,21 @@ exports:
 - Invalidate a session
 - Invalidate all sessions for a student
 - Extend a session's expiration time
+- Register a listener that is told the token of every session that is invalidated or extended
 
 tests:
 - Creating a session generates a unique token
 - Creating multiple sessions for the same student generates different tokens
+- Session tokens contain only URL-safe characters and carry at least 256 bits of randomness
 - A newly created session is valid
 - A session becomes invalid after its expiration time
 - An invalidated session is no longer valid
 - Finding a session by token returns the correct session
 - Finding a session with an invalid token returns nothing
 - Invalidating all sessions for a student invalidates all their active sessions
+- Invalidating all sessions for a student leaves other students' sessions valid
+- Expired sessions can no longer be found by token once they have been cleaned up
 - Extending a session updates its expiration time
+- A session extended before its original expiry is not removed by cleanup
 - Extending an already invalid session fails
+- A registered listener is told about a session invalidated on its own, all sessions invalidated for a student, and an extended session
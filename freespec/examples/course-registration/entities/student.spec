@@ -1,12 +1,16 @@
 # student.spec
 
 description:
-A student is a user who can authenticate and register for courses. Each student has an email address which serves as their unique identifier and login credential. Email addresses are case-insensitive, so "John@Example.com" and "john@example.com" refer to the same student.
+A student is a user who can authenticate and register for courses. Each student has an email address which serves as their unique identifier and login credential. Email addresses are case-insensitive, so "John@Example.com" and "john@example.com" refer to the same student. An email is normalized with full Unicode case folding; the normalized form is computed once when the student is created and stored with the student, and each lookup normalizes its query exactly once. Students are indexed by normalized email, so finding a student by email and checking that an email is free when creating a student take constant time regardless of how many students exist.
 
-Students have a name for display purposes and a password for authentication. Passwords are never stored in plain text; only a secure hash is kept. The password must be at least 8 characters long.
+Students have a name for display purposes and a password for authentication. Passwords are never stored in plain text; only a secure hash is kept, produced by a deliberately slow, salted key-derivation function. Verifying a password compares derived values in constant time, and neither the password nor anything derived from it is cached between verifications. The password must be at least 8 characters long.
+
+A student may also be an administrator, which grants access to the admin-only endpoints. Students are not administrators when created; administrator status is granted and revoked explicitly, and updating a student's name or password never changes it.
 
 Students can be active or inactive. Only active students can log in and register for courses. A student starts as active when created.
 
+The student directory has a version number that increases whenever any student is created or changes, including name, password, active status, and administrator status. While the directory version is unchanged, every student record is exactly as it was when the version was read.
+
 exports:
 - Create a new student with email, name, and password
 - Find a student by their email address
@@ -14,8 +18,10 @@ exports:
 - Update a student's name or password
 - Deactivate a student
 - Reactivate a student
+- Grant or revoke administrator status for a student
 - List all students with optional filters for active status
 - Verify a password matches for a given student
+- Get the student directory version number
 
 tests:
 - Creating a student with valid email, name, and password succeeds
@@ -24,8 +30,15 @@ tests:
 - Creating a student with password shorter than 8 characters fails
 - Creating a student with invalid email format fails
 - Finding a student by email is case-insensitive
+- Finding a student by email matches addresses that differ only by Unicode case folding, such as "STRASSE@example.com" and "straße@example.com"
 - Verifying correct password returns success
 - Verifying incorrect password returns failure
 - Inactive students cannot have their password verified
 - Updating password to one shorter than 8 characters fails
 - Deactivating an already inactive student succeeds without error
+- A newly created student is not an administrator
+- Granting administrator status makes the student an administrator
+- Revoking administrator status makes the student a regular student again
+- Updating a student's name or password does not change their administrator status
+- The student directory version increases when a student is created, updated, deactivated, reactivated, or has their administrator status changed
+- The student directory version is unchanged by lookups, listings, and password verification
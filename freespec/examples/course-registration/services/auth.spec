@@ -7,13 +7,19 @@ Login accepts an email and password. If the credentials are valid and the studen
 
 Logout invalidates the current session. It requires a valid session token.
 
+Every authenticated API request resolves its session token to the student it belongs to, so this lookup sits on the hot path. Resolution returns the student's ID together with whether they are an administrator, so endpoints that check admin privileges need no second lookup. The administrator flag is never remembered: each resolution reads it from @entities/student by ID, a constant-time lookup, so granting or revoking administrator status takes effect on the very next request. The service may remember which student a resolved token belongs to for a few seconds to avoid repeating the lookup, but never beyond the session's expiration time. Every path that invalidates a token or changes its expiry must forget the remembered token immediately: logging out, invalidating the session through @entities/session, invalidating all of the student's sessions, and extending the session. The service registers with @entities/session to be told about each of these, so invalidations that do not go through the service are covered too.
+
+The service also owns the parsing of the Authorization header, so every API shares one implementation. A header yields a token only when it starts with exactly "Bearer " followed by a non-empty token; a missing header, a different scheme, or an empty token yields nothing.
+
 Registration creates a new student account. It requires email, name, and password. After successful registration, the student can immediately log in.
 
-The service enforces rate limiting on login attempts. After 5 failed attempts for the same email within 15 minutes, further attempts are temporarily blocked for that email.
+The service enforces rate limiting on login attempts. After 5 failed attempts for the same email within 15 minutes, further attempts are temporarily blocked for that email. Failures are counted per normalized email as defined by @entities/student, so differently-cased spellings of one address share a single count. Only the five most recent failure times per email are kept, so memory per email is bounded: an email is rate-limited exactly when it has five recorded failures and the oldest of them is less than 15 minutes old.
 
 exports:
 - Login with email and password, returning a session token
 - Logout using a session token
+- Resolve a session token to the authenticated student and their admin status
+- Extract the session token from an Authorization header
 - Register a new student account
 - Check if an email is rate-limited
 
@@ -25,8 +31,21 @@ tests:
 - Logout with valid token invalidates the session
 - Logout with invalid token fails
 - Logout with expired token fails
+- Resolving a valid token returns the student who owns the session
+- Resolving a token reports whether the student is an administrator
+- A token resolved just before the student's administrator status is revoked reports the student as a regular student immediately afterwards
+- A token resolved just before the student is granted administrator status reports the student as an administrator immediately afterwards
+- Resolving an expired or invalidated token returns nothing
+- A token resolved just before logout is rejected immediately after logout
+- A token resolved just before its session is invalidated directly on the session entity is rejected immediately afterwards
+- A token resolved just before all of its student's sessions are invalidated is rejected immediately afterwards
+- A token resolved just before its session is extended is still accepted and remembered only until the new expiration time
+- Extracting a token from "Bearer abc123" returns "abc123"
+- Extracting a token from a missing header, a non-Bearer scheme, or "Bearer " with nothing after it returns nothing
 - Register with valid data creates a new student
 - Register with existing email fails
 - After 5 failed logins, further attempts for that email are rate-limited
 - Rate limit resets after 15 minutes
+- Failures spread over more than 15 minutes do not trigger the rate limit
 - Successful login resets the failure count for that email
+- Failed logins with differently-cased spellings of one email count toward the same limit
@@ -3,28 +3,43 @@
 description:
 The enrollment service manages student course registration. It coordinates between @entities/student, @entities/course, and @entities/registration to handle the business logic of enrolling in courses.
 
-When a student attempts to register for a course, several conditions are checked. The course must be open for registration. The course must have available seats. The student must have completed all prerequisite courses. The student must not already be enrolled in the course.
+When a student attempts to register for a course, several conditions are checked. The course must be open for registration. The course must have available seats. The student must have completed all prerequisite courses; this is checked by asking @entities/registration once which of the course's prerequisites the student has completed, not by looking up each prerequisite separately. The student must not already be enrolled in the course.
 
-Dropping a course updates the registration status and frees up a seat for other students. Students can only drop courses they are currently enrolled in.
+The open and available-seat conditions are enforced by reserving the seat on @entities/course as one atomic step after the other checks pass, rather than reading the seat count first and inserting afterwards; if the reservation fails, its closed or full reason is reported. A successful registration therefore holds a reserved seat on the course. If creating the registration then fails because the student is already enrolled, the reserved seat is released before the failure is reported. A student can also register for several courses in one call. The service checks prerequisites for all requested courses with one completed-course lookup, applies the same rules as a single registration to each course, and returns an outcome per course: registered, or the reason it failed. One course failing does not prevent the others from succeeding.
+
+Dropping a course updates the registration status and releases the seat for other students. Students can only drop courses they are currently enrolled in.
 
 Completing a course is typically done by an administrator. It marks the student as having successfully finished the course, which then counts toward prerequisites for other courses.
 
-The service can retrieve a student's schedule, showing all courses they are currently enrolled in, and their history, showing all registrations including completed and dropped courses.
+For end-of-term audits the service can also answer, in one call, which of a group of students meet the prerequisites for which of a group of courses. The audit computes the prerequisite relationships of all involved courses once and then checks every student against them, instead of walking the prerequisite graph separately for each student and course.
+
+The service can retrieve a student's schedule, showing all courses they are currently enrolled in, and their history, showing all registrations including completed and dropped courses. Both load the student's registrations together with their courses in a single request to @entities/registration, restricted to enrolled registrations for the schedule, and never look up courses one registration at a time. Wherever the service already holds a list of registrations, such as kept history registrations or one chunk of a streamed history, it fetches their courses with a single multi-ID lookup on @entities/course.
+
+A student's registrations are kept together with the student's registration version from @entities/registration at the time they were read. Retrieving the history again reads that version first and reuses the kept registrations if the version has not changed, so the registrations are only reloaded after the student registers, drops, or completes a course. Only the registrations are kept, never course data: each history view joins them with the current courses through a single multi-ID lookup on @entities/course, so a renamed course or changed capacity shows up immediately.
+
+For administrators reviewing long multi-year histories, the service can also stream a student's history. It reads the registrations from @entities/registration in chunks and loads the courses for each chunk with a single multi-ID lookup on @entities/course, so only one chunk is held at a time.
 
 exports:
 - Register a student for a course
+- Register a student for several courses at once
 - Drop a student from a course
 - Mark a student as having completed a course
 - Get a student's current schedule
 - Get a student's registration history
+- Stream a student's registration history in chunks
 - Check if a student meets prerequisites for a course
+- Check prerequisites for many students and courses at once
 
 tests:
 - Registering for an open course with available seats succeeds
 - Registering for a closed course fails
 - Registering for a full course fails
+- Concurrent registrations for the last seat in a course admit exactly one student
 - Registering without meeting prerequisites fails
 - Registering for a course already enrolled in fails
+- A failed duplicate registration does not consume a seat
+- Registering for several courses at once enrolls the student in every eligible course
+- Registering for several courses at once reports a reason for each course that fails without affecting the others
 - Dropping an enrolled course succeeds and frees a seat
 - Dropping a course not enrolled in fails
 - Dropping a completed course fails
@@ -32,5 +47,10 @@ tests:
 - Completed courses count toward prerequisites
 - Schedule shows only currently enrolled courses
 - History shows enrolled, completed, and dropped registrations
+- Streaming a history yields the same registrations as retrieving it in full
+- History retrieved again after a new registration, drop, or completion includes the change
+- History retrieved again after a course in it is renamed shows the new course title
 - Prerequisite check returns true when all prerequisites are completed
 - Prerequisite check returns false when any prerequisite is missing
+- Bulk prerequisite check gives the same answer as checking each student and course individually
+- Bulk prerequisite check treats a course without prerequisites as met for every student
@@ -8,30 +8,42 @@ Supports a two-pass compilation architecture:
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
 import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
 from freespec.config import ConfigError, FreeSpecConfig, find_config, load_config
-from freespec.generator.compiler import CompileError, IndependentCompiler
-from freespec.generator.cpp_runner import CppRunnerError, CppTestRunner
-from freespec.generator.headers import HeaderGenerationError, HeaderGenerator, load_headers
-from freespec.generator.impl import ImplementationError, ImplementationGenerator
-from freespec.generator.runner import PytestRunner, RunnerError
-from freespec.generator.stubs import GenerationError
-from freespec.generator.tests import SkeletonGenError, SkeletonTestGenerator
-from freespec.llm.claude_code import ClaudeCodeClient
-from freespec.llm.session_logger import SessionLogger
 from freespec.parser.dependency import DependencyResolver
+from freespec.parser.models import SpecFile
+from freespec.parser.spec_cache import SpecCache
 from freespec.parser.spec_parser import ParseError, SpecParser
-from freespec.rebuild.detector import RebuildDetector
-from freespec.verifier.imports import ImportVerifier
+
+if TYPE_CHECKING:
+    from freespec.generator.headers import HeaderContext, HeaderGenerator
+    from freespec.rebuild.detector import DetectionResult, RebuildDetector
+
+# Generator (including the test runners), LLM, rebuild and verifier modules are
+# imported inside the commands that use them, so validate, show and --help start
+# without loading them.
 
 # Valid language options
 VALID_LANGUAGES = ("python", "cpp", "c++")
 
+# Thread pool size for overlapping spec and source file reads
+_IO_WORKERS = 16
+
+# Source file extension per language
+_LANG_EXT = {"python": ".py", "cpp": ".cpp", "c++": ".cpp"}
+
 
 def setup_logging(verbose: bool) -> None:
     """Configure logging based on verbosity.
@@ -46,6 +58,74 @@ def setup_logging(verbose: bool) -> None:
     )
 
 
+@functools.cache
+def _get_parser() -> SpecParser:
+    """Get the process-wide spec parser (stateless, so safe to share)."""
+    return SpecParser()
+
+
+@functools.cache
+def _get_resolver() -> DependencyResolver:
+    """Get the process-wide dependency resolver (stateless, so safe to share)."""
+    return DependencyResolver()
+
+
+def _parse_spec_patterns(
+    parser: SpecParser, config: FreeSpecConfig, save_cache: bool = False
+) -> list[tuple[str, list[SpecFile]]]:
+    """Parse the spec files for every configured pattern.
+
+    Files are globbed up front and then read and parsed on a thread pool,
+    since parsing is dominated by file I/O. Files unchanged since the last
+    run are served from the on-disk spec cache. Results keep pattern and
+    file order.
+
+    Args:
+        parser: Parser used for each spec file.
+        config: Project configuration providing the patterns and root path.
+        save_cache: Whether to write the updated spec cache back to the
+            output directory. Only commands that generate output save it.
+
+    Returns:
+        List of (pattern, parsed specs) pairs in configuration order.
+
+    Raises:
+        ParseError: If any spec file is invalid.
+    """
+    paths_by_pattern = [
+        (pattern, parser.find_files(pattern, config.root_path)) for pattern in config.specs
+    ]
+    cache = SpecCache.load(config.get_spec_cache_path())
+    with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+        results = [
+            (pattern, list(executor.map(lambda path: cache.parse_file(parser, path), paths)))
+            for pattern, paths in paths_by_pattern
+        ]
+    if save_cache:
+        cache.save()
+    return results
+
+
+def _parse_all_specs(
+    parser: SpecParser, config: FreeSpecConfig, save_cache: bool = False
+) -> list[SpecFile]:
+    """Parse the spec files for every configured pattern into one list.
+
+    Args:
+        parser: Parser used for each spec file.
+        config: Project configuration providing the patterns and root path.
+        save_cache: Whether to write the updated spec cache back.
+
+    Returns:
+        All parsed specs in configuration order.
+
+    Raises:
+        ParseError: If any spec file is invalid.
+    """
+    parsed_by_pattern = _parse_spec_patterns(parser, config, save_cache)
+    return list(chain.from_iterable(parsed for _, parsed in parsed_by_pattern))
+
+
 @click.group()
 @click.version_option()
 def main() -> None:
@@ -89,6 +169,9 @@ def headers(
     Headers are generated independently without dependency ordering.
     Each header defines the public API with NotImplementedError implementations.
     """
+    from freespec.generator.headers import HeaderGenerationError, HeaderGenerator
+    from freespec.llm.claude_code import ClaudeCodeClient
+
     setup_logging(verbose)
 
     try:
@@ -102,11 +185,8 @@ def headers(
 
         # Parse spec files
         click.echo("\nParsing spec files...")
-        parser = SpecParser()
-        specs = []
-        for pattern in config.specs:
-            parsed = parser.parse_glob(pattern, config.root_path)
-            specs.extend(parsed)
+        parser = _get_parser()
+        specs = _parse_all_specs(parser, config, save_cache=True)
 
         if not specs:
             click.echo("  No spec files found!", err=True)
@@ -115,7 +195,7 @@ def headers(
         click.echo(f"  Found {len(specs)} spec files")
 
         # Validate dependencies (warn only, don't fail on cycles)
-        resolver = DependencyResolver()
+        resolver = _get_resolver()
         _, missing_deps = resolver.get_all_specs(specs, validate=True)
 
         if missing_deps:
@@ -199,6 +279,11 @@ def impl(
     Requires headers to be generated first. Uses all headers as context
     so circular @mentions are supported.
     """
+    from freespec.generator.headers import load_headers
+    from freespec.generator.impl import ImplementationError, ImplementationGenerator
+    from freespec.llm.claude_code import ClaudeCodeClient
+    from freespec.verifier.imports import ImportVerifier
+
     setup_logging(verbose)
 
     try:
@@ -220,11 +305,8 @@ def impl(
 
         # Parse spec files
         click.echo("\nParsing spec files...")
-        parser = SpecParser()
-        specs = []
-        for pattern in config.specs:
-            parsed = parser.parse_glob(pattern, config.root_path)
-            specs.extend(parsed)
+        parser = _get_parser()
+        specs = _parse_all_specs(parser, config, save_cache=True)
 
         if not specs:
             click.echo("  No spec files found!", err=True)
@@ -253,7 +335,9 @@ def impl(
             click.echo("\nVerifying imports...")
             verifier = ImportVerifier()
             impl_paths = [f.path for f in context.generated_files]
-            result = verifier.verify_cross_imports(impl_paths, config.get_src_path(language))
+            result = verifier.verify_cross_imports(
+                impl_paths, config.get_src_path(language), num_workers=workers
+            )
 
             if result.success:
                 click.echo("  All imports verified successfully")
@@ -303,12 +387,29 @@ def impl(
     is_flag=True,
     help="Enable verbose output",
 )
-def tests(config_path: Path | None, language: str, from_headers: bool, verbose: bool) -> None:
+@click.option(
+    "--workers",
+    "num_workers",
+    type=int,
+    default=None,
+    help="Number of parallel Claude instances (default: from config or 4)",
+)
+def tests(
+    config_path: Path | None,
+    language: str,
+    from_headers: bool,
+    verbose: bool,
+    num_workers: int | None,
+) -> None:
     """Generate test skeleton files.
 
     By default, generates tests from implementation files.
     Use --from-headers for TDD workflow (tests before implementation).
     """
+    from freespec.generator.headers import load_headers
+    from freespec.generator.tests import SkeletonGenError, SkeletonTestGenerator
+    from freespec.llm.claude_code import ClaudeCodeClient
+
     setup_logging(verbose)
 
     try:
@@ -338,11 +439,8 @@ def tests(config_path: Path | None, language: str, from_headers: bool, verbose:
 
         # Parse spec files
         click.echo("\nParsing spec files...")
-        parser = SpecParser()
-        specs = []
-        for pattern in config.specs:
-            parsed = parser.parse_glob(pattern, config.root_path)
-            specs.extend(parsed)
+        parser = _get_parser()
+        specs = _parse_all_specs(parser, config, save_cache=True)
 
         if not specs:
             click.echo("  No spec files found!", err=True)
@@ -358,8 +456,11 @@ def tests(config_path: Path | None, language: str, from_headers: bool, verbose:
 
         # Generate tests
         click.echo("\nGenerating test skeletons...")
+        workers = num_workers if num_workers is not None else config.settings.parallelism
         generator = SkeletonTestGenerator(client=client)
-        context = generator.generate_all_tests(specs, config, source_code, language)
+        context = generator.generate_all_tests(
+            specs, config, source_code, language, num_workers=workers
+        )
 
         click.echo(f"  Generated {len(context.generated_files)} test files")
         click.echo(f"\nTests written to: {config.get_tests_path(language)}")
@@ -375,6 +476,37 @@ def tests(config_path: Path | None, language: str, from_headers: bool, verbose:
         sys.exit(1)
 
 
+def _iter_source_files(root: Path, ext: str) -> Iterator[tuple[str, os.DirEntry[str]]]:
+    """Walk a source tree for implementation files with os.scandir.
+
+    Names are filtered straight from the directory entries, so rejected
+    files never cost a stat call or a Path object.
+
+    Args:
+        root: Directory to walk.
+        ext: File extension to match (e.g. '.py').
+
+    Yields:
+        (category, entry) pairs, where category is the name of the file's
+        directory, or '' for files directly in root. Package markers and
+        test files are skipped.
+    """
+    stack = [(str(root), "")]
+    while stack:
+        directory, category = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, entry.name))
+                elif (
+                    entry.name.endswith(ext)
+                    and entry.name != "__init__.py"
+                    and not entry.name.startswith("test_")
+                    and entry.is_file()
+                ):
+                    yield category, entry
+
+
 def _load_implementations(config: FreeSpecConfig, language: str) -> dict[str, str]:
     """Load all existing implementation files.
 
@@ -385,30 +517,68 @@ def _load_implementations(config: FreeSpecConfig, language: str) -> dict[str, st
     Returns:
         Map of spec_id to implementation content.
     """
-    impls: dict[str, str] = {}
+    impl_files: dict[str, Path] = {}
 
     # Determine file extension based on language
-    ext = ".py" if language.lower() == "python" else ".cpp"
+    ext = _LANG_EXT[language.lower()]
 
     # Load from src directory (implementations are in same place as headers)
     src_dir = config.get_src_path(language)
     if src_dir.exists():
-        for impl_file in src_dir.rglob(f"*{ext}"):
-            if impl_file.name == "__init__.py":
-                continue
-            # Skip test files
-            if impl_file.name.startswith("test_"):
-                continue
-            relative = impl_file.relative_to(src_dir)
-            category = relative.parent.name if relative.parent.name else ""
-            name = impl_file.stem
+        for category, entry in _iter_source_files(src_dir, ext):
+            name = entry.name[: -len(ext)]
             if category:
                 spec_id = f"{category}/{name}"
             else:
                 spec_id = name
-            impls[spec_id] = impl_file.read_text()
+            impl_files[spec_id] = Path(entry.path)
+
+    if not impl_files:
+        return {}
+
+    # Reading is pure I/O, so overlap the reads on a thread pool
+    max_workers = min(_IO_WORKERS, len(impl_files))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        contents = executor.map(Path.read_text, impl_files.values())
+        return dict(zip(impl_files, contents))
+
+
+def _generate_and_load_headers(
+    header_generator: HeaderGenerator,
+    header_specs: list[SpecFile],
+    config: FreeSpecConfig,
+    language: str,
+    detector: RebuildDetector,
+    workers: int,
+) -> tuple[HeaderContext, dict[str, str]]:
+    """Generate headers for changed specs while loading the existing ones.
+
+    Reading the unchanged headers from disk overlaps with the LLM-bound
+    generation. A header read while it was being rewritten is harmless:
+    the freshly generated headers are applied last, so they always replace
+    whatever was read from disk.
+
+    Args:
+        header_generator: Generator used for the changed specs.
+        header_specs: Specs whose headers need regenerating.
+        config: Project configuration.
+        language: Target language.
+        detector: Rebuild detector updated with the new headers.
+        workers: Number of parallel generation workers.
+
+    Returns:
+        Tuple of (header generation context, map of spec_id to header content).
+    """
+    from freespec.generator.headers import load_headers
 
-    return impls
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        existing_future = executor.submit(load_headers, config, language)
+        header_context = header_generator.generate_all_headers(
+            header_specs, config, language, detector=detector, num_workers=workers
+        )
+        all_headers = existing_future.result()
+    all_headers.update(header_context.headers)
+    return header_context, all_headers
 
 
 @main.command()
@@ -497,6 +667,15 @@ def compile(
 
     Files "compile" successfully only when their tests pass.
     """
+    from freespec.generator.compiler import CompileError, IndependentCompiler
+    from freespec.generator.cpp_runner import CppRunnerError, CppTestRunner
+    from freespec.generator.headers import HeaderGenerationError, HeaderGenerator, load_headers
+    from freespec.generator.runner import PytestRunner, RunnerError
+    from freespec.generator.stubs import GenerationError
+    from freespec.llm.claude_code import ClaudeCodeClient
+    from freespec.llm.session_logger import SessionLogger
+    from freespec.rebuild.detector import RebuildDetector
+
     setup_logging(verbose)
 
     try:
@@ -510,12 +689,11 @@ def compile(
 
         # Stage 1: Parse spec files
         click.echo("\nStage 1: Parsing spec files...")
-        parser = SpecParser()
-        specs = []
-        for pattern in config.specs:
-            parsed = parser.parse_glob(pattern, config.root_path)
-            specs.extend(parsed)
+        parser = _get_parser()
+        parsed_by_pattern = _parse_spec_patterns(parser, config, save_cache=not dry_run)
+        for pattern, parsed in parsed_by_pattern:
             click.echo(f"  Found {len(parsed)} specs matching '{pattern}'")
+        specs = list(chain.from_iterable(parsed for _, parsed in parsed_by_pattern))
 
         if not specs:
             click.echo("  No spec files found!", err=True)
@@ -526,7 +704,11 @@ def compile(
         # Filter to single file if --file specified
         if spec_file:
             spec_file = spec_file.resolve()
-            matching = [s for s in specs if s.path.resolve() == spec_file]
+            # An absolute path equal to the resolved target needs no resolving;
+            # only fall back to resolve() (a syscall per spec) for symlinked paths
+            matching = [s for s in specs if Path(os.path.abspath(s.path)) == spec_file]
+            if not matching:
+                matching = [s for s in specs if s.path.resolve() == spec_file]
             if not matching:
                 click.echo(f"  Error: {spec_file} not found in configured specs", err=True)
                 sys.exit(1)
@@ -537,7 +719,7 @@ def compile(
 
         # Build dependency graph and validate
         click.echo("\nValidating dependencies...")
-        resolver = DependencyResolver()
+        resolver = _get_resolver()
         graph = resolver.build_graph(specs)
         missing_deps = resolver.validate_dependencies(graph)
 
@@ -564,6 +746,9 @@ def compile(
         # Report what will be rebuilt
         _report_rebuild_plan(detection, verbose)
 
+        # Index the specs once; detection results are lists of spec IDs
+        specs_by_id = {s.spec_id: s for s in compile_specs}
+
         if dry_run:
             click.echo("\n[Dry run] Skipping code generation")
             return
@@ -574,9 +759,7 @@ def compile(
         click.echo(f"\nLogs will be saved to: {log_dir}")
 
         # Create session logger for comprehensive logging
-        import time
-
-        session_start_time = time.time()
+        session_start_time = time.perf_counter()
 
         session_logger = SessionLogger(
             log_dir=log_dir,
@@ -586,36 +769,39 @@ def compile(
         text_log, json_log = session_logger.get_log_paths()
         click.echo(f"Session log: {text_log}")
 
-        # Check Claude Code availability
         client = ClaudeCodeClient(
             working_dir=config.root_path,
             log_dir=log_dir,
             stream_output=verbose,
             session_logger=session_logger,
         )
-        if not client.check_available():
-            click.echo("  Error: Claude Code CLI not available", err=True)
-            click.echo("  Please ensure 'claude' is installed and in PATH", err=True)
-            sys.exit(1)
 
-        # Check test runner availability based on language
-        lang = language.lower()
-        if lang == "python":
-            click.echo("\nChecking pytest availability...")
-            runner = PytestRunner(working_dir=config.root_path)
-            try:
-                runner.check_available()
-                click.echo("  pytest is available")
-            except RunnerError as e:
-                click.echo(f"  Error: {e}", err=True)
+        # Pick the test runner (display name, class) for the language
+        lang_runners: dict[str, tuple[str, type[PytestRunner] | type[CppTestRunner]]] = {
+            "python": ("pytest", PytestRunner),
+            "cpp": ("C++ compiler", CppTestRunner),
+            "c++": ("C++ compiler", CppTestRunner),
+        }
+        runner_name, runner_class = lang_runners[language.lower()]
+        runner = runner_class(working_dir=config.root_path)
+
+        # Both availability checks spawn a subprocess, so run them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            client_future = executor.submit(client.check_available)
+            runner_future = executor.submit(runner.check_available)
+
+            # Check Claude Code availability
+            if not client_future.result():
+                click.echo("  Error: Claude Code CLI not available", err=True)
+                click.echo("  Please ensure 'claude' is installed and in PATH", err=True)
                 sys.exit(1)
-        elif lang in ("cpp", "c++"):
-            click.echo("\nChecking C++ compiler availability...")
-            cpp_runner = CppTestRunner(working_dir=config.root_path)
+
+            # Check test runner availability based on language
+            click.echo(f"\nChecking {runner_name} availability...")
             try:
-                cpp_runner.check_available()
-                click.echo("  C++ compiler is available")
-            except CppRunnerError as e:
+                runner_future.result()
+                click.echo(f"  {runner_name} is available")
+            except (RunnerError, CppRunnerError) as e:
                 click.echo(f"  Error: {e}", err=True)
                 sys.exit(1)
 
@@ -629,28 +815,27 @@ def compile(
             click.echo(f"  Loaded {len(all_headers)} existing headers")
         else:
             # Filter to specs needing header generation
-            header_specs = [s for s in specs if s.spec_id in detection.header_specs]
+            header_specs = [
+                specs_by_id[spec_id] for spec_id in detection.header_specs if spec_id in specs_by_id
+            ]
             if header_specs:
                 click.echo(f"\nStage 3: Generating headers for {len(header_specs)} spec(s)...")
                 workers = num_workers if num_workers is not None else config.settings.parallelism
                 header_generator = HeaderGenerator(client=client)
-                header_context = header_generator.generate_all_headers(
-                    header_specs, config, language, detector=detector, num_workers=workers
+                header_context, all_headers = _generate_and_load_headers(
+                    header_generator, header_specs, config, language, detector, workers
                 )
-                all_headers = header_context.headers
                 click.echo(f"  Generated {len(header_context.generated_files)} header files")
-                # Also load existing headers for unchanged specs
-                existing_headers = load_headers(config, language)
-                all_headers.update(existing_headers)
             else:
                 click.echo("\nStage 3: Loading existing headers (no changes needed)...")
                 all_headers = load_headers(config, language)
                 click.echo(f"  Loaded {len(all_headers)} existing headers")
 
         # Stage 4: Independent compilation (Pass 2)
-        # Filter to specs needing implementation rebuild
-        impl_spec_ids = set(detection.impl_specs)
-        impl_specs = [s for s in compile_specs if s.spec_id in impl_spec_ids]
+        # Specs needing implementation rebuild, in the detector's dependency order
+        impl_specs = [
+            specs_by_id[spec_id] for spec_id in detection.impl_specs if spec_id in specs_by_id
+        ]
 
         if impl_specs:
             click.echo(f"\nStage 4: Independent compilation of {len(impl_specs)} spec(s)...")
@@ -667,14 +852,15 @@ def compile(
                 num_workers=workers,
             )
 
-            # Report results
-            click.echo("\nCompilation Results:")
+            # Report results, written as one block
+            lines = ["\nCompilation Results:"]
             for result in compile_context.results:
                 status = "[PASS]" if result.success else "[FAIL]"
                 duration = f"({result.duration_seconds:.1f}s)" if result.duration_seconds else ""
-                click.echo(f"  {status} {result.spec_id} {duration}")
+                lines.append(f"  {status} {result.spec_id} {duration}")
                 if result.log_file:
-                    click.echo(f"       Log: {result.log_file}")
+                    lines.append(f"       Log: {result.log_file}")
+            click.echo("\n".join(lines))
 
             # Summary
             passed = len(compile_context.passed)
@@ -683,15 +869,16 @@ def compile(
             click.echo(f"\nSummary: {passed}/{total} modules compiled successfully")
 
             if compile_context.failed:
-                click.echo("\nFailed modules:", err=True)
+                lines = ["\nFailed modules:"]
                 for result in compile_context.failed:
-                    click.echo(f"  - {result.spec_id}", err=True)
+                    lines.append(f"  - {result.spec_id}")
                     if result.error and verbose:
                         # Truncate long errors
                         error_preview = result.error[:500]
                         if len(result.error) > 500:
                             error_preview += "..."
-                        click.echo(f"    Error: {error_preview}", err=True)
+                        lines.append(f"    Error: {error_preview}")
+                click.echo("\n".join(lines), err=True)
                 sys.exit(1)
         else:
             click.echo("\nStage 4: No implementations need rebuilding")
@@ -699,7 +886,7 @@ def compile(
             failed = 0
 
         # Log session summary
-        session_duration = time.time() - session_start_time
+        session_duration = time.perf_counter() - session_start_time
         session_logger.log_summary(
             total_specs=len(impl_specs) if impl_specs else 0,
             successful_specs=passed,
@@ -744,7 +931,16 @@ def compile(
         sys.exit(1)
 
 
-def _report_rebuild_plan(detection, verbose: bool) -> None:
+# What a rebuild does, keyed by (needs_header, needs_impl)
+_REBUILD_ACTIONS = {
+    (True, True): "header + impl",
+    (True, False): "header",
+    (False, True): "impl",
+    (False, False): "impl",
+}
+
+
+def _report_rebuild_plan(detection: DetectionResult, verbose: bool) -> None:
     """Report what will be rebuilt.
 
     Args:
@@ -758,26 +954,20 @@ def _report_rebuild_plan(detection, verbose: bool) -> None:
         click.echo("  Nothing to rebuild")
         return
 
-    click.echo(f"  Would rebuild {rebuild_count} of {total} specs:")
+    # Collect the whole report and write it once instead of once per spec
+    lines = [f"  Would rebuild {rebuild_count} of {total} specs:"]
 
     for spec_id in detection.impl_specs:
         info = detection.rebuild_info.get(spec_id)
         if info:
-            reasons = [r.value for r in info.reasons]
-            reason_str = ", ".join(reasons)
-
-            # Determine what needs to be done
-            if info.needs_header and info.needs_impl:
-                action = "header + impl"
-            elif info.needs_header:
-                action = "header"
-            else:
-                action = "impl"
-
-            click.echo(f"    {spec_id} ({reason_str} -> {action})")
+            reason_str = ", ".join(r.value for r in info.reasons)
+            action = _REBUILD_ACTIONS[info.needs_header, info.needs_impl]
+            lines.append(f"    {spec_id} ({reason_str} -> {action})")
 
             if verbose and info.triggering_deps:
-                click.echo(f"      Triggered by: {', '.join(info.triggering_deps)}")
+                lines.append(f"      Triggered by: {', '.join(info.triggering_deps)}")
+
+    click.echo("\n".join(lines))
 
 
 @main.command()
@@ -804,15 +994,13 @@ def validate(config_path: Path | None) -> None:
         click.echo(f"Project: {config.name} v{config.version}")
 
         # Parse spec files
-        parser = SpecParser()
-        specs = []
-        for pattern in config.specs:
-            specs.extend(parser.parse_glob(pattern, config.root_path))
+        parser = _get_parser()
+        specs = _parse_all_specs(parser, config)
 
         click.echo(f"Parsed {len(specs)} spec files")
 
         # Validate dependencies (allow cycles)
-        resolver = DependencyResolver()
+        resolver = _get_resolver()
         _, missing_deps = resolver.get_all_specs(specs, validate=True)
 
         if missing_deps:
@@ -844,7 +1032,7 @@ def show(spec_path: Path) -> None:
     Useful for debugging spec parsing.
     """
     try:
-        parser = SpecParser()
+        parser = _get_parser()
         spec = parser.parse_file(spec_path)
 
         click.echo(f"Spec: {spec.spec_id}")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -66,13 +67,17 @@ class FreeSpecConfig:
             Parsed configuration object.
 
         Raises:
-            ConfigError: If required fields are missing.
+            ConfigError: If required fields are missing or specs is not a list.
         """
         required_fields = ["name", "version", "specs"]
         missing = [f for f in required_fields if f not in data]
         if missing:
             raise ConfigError(f"Missing required fields: {', '.join(missing)}")
 
+        specs = data["specs"]
+        if not isinstance(specs, list) or not all(isinstance(p, str) for p in specs):
+            raise ConfigError("'specs' must be a list of glob patterns")
+
         output_data = data.get("output", {})
         output = OutputConfig(
             out=output_data.get("out", "out/"),
@@ -90,7 +95,7 @@ class FreeSpecConfig:
         return cls(
             name=data["name"],
             version=data["version"],
-            specs=data["specs"],
+            specs=list(specs),
             output=output,
             settings=settings,
             root_path=root_path,
@@ -154,10 +159,25 @@ class FreeSpecConfig:
         """
         return self.root_path / self.output.out / language / ".freespec_build.json"
 
+    def get_spec_cache_path(self) -> Path:
+        """Get absolute path to the parsed spec cache file.
+
+        Parsed specs do not depend on the target language, so one cache
+        is shared by all languages.
+
+        Returns:
+            Absolute path to out/.freespec_specs.json.
+        """
+        return self.root_path / self.output.out / ".freespec_specs.json"
+
 
 def load_config(config_path: Path | str) -> FreeSpecConfig:
     """Load FreeSpec configuration from a YAML file.
 
+    The parsed YAML is cached per process, keyed by the file's path,
+    modification time and size, so repeated loads of an unchanged file skip
+    the YAML parse. Each call still returns a fresh FreeSpecConfig.
+
     Args:
         config_path: Path to freespec.yaml file.
 
@@ -169,24 +189,49 @@ def load_config(config_path: Path | str) -> FreeSpecConfig:
     """
     config_path = Path(config_path)
 
-    if not config_path.exists():
-        raise ConfigError(f"Configuration file not found: {config_path}")
+    try:
+        stat = config_path.stat()
+    except OSError:
+        raise ConfigError(f"Configuration file not found: {config_path}") from None
 
     try:
-        with open(config_path) as f:
-            data = yaml.safe_load(f)
+        data = _read_config_data(config_path.resolve(), stat.st_mtime_ns, stat.st_size)
     except yaml.YAMLError as e:
         raise ConfigError(f"Invalid YAML in {config_path}: {e}") from e
+    return FreeSpecConfig.from_dict(data, config_path.parent)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_config_data(config_path: Path, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Read and validate the YAML mapping in a config file.
+
+    Args:
+        config_path: Resolved path to freespec.yaml.
+        mtime_ns: Modification time, part of the cache key only.
+        size: File size, part of the cache key only.
+
+    Returns:
+        The top-level YAML mapping.
+
+    Raises:
+        yaml.YAMLError: If the file is not valid YAML.
+        ConfigError: If the file is not a mapping.
+    """
+    with open(config_path) as f:
+        data = yaml.safe_load(f)
 
     if not isinstance(data, dict):
         raise ConfigError(f"Configuration must be a YAML mapping, got {type(data).__name__}")
 
-    return FreeSpecConfig.from_dict(data, config_path.parent)
+    return data
 
 
 def find_config(start_path: Path | str | None = None) -> Path:
     """Find freespec.yaml by walking up directory tree.
 
+    Lookups are cached per starting directory; a cached result is only
+    reused while it still names an existing file.
+
     Args:
         start_path: Starting directory. Defaults to current directory.
 
@@ -203,6 +248,27 @@ def find_config(start_path: Path | str | None = None) -> Path:
 
     current = start_path.resolve()
 
+    config_path = _find_config_from(current)
+    if config_path is None or not config_path.exists():
+        _find_config_from.cache_clear()
+        config_path = _find_config_from(current)
+
+    if config_path is None:
+        raise ConfigError(f"No freespec.yaml found in {start_path} or any parent directory")
+
+    return config_path
+
+
+@functools.lru_cache(maxsize=32)
+def _find_config_from(current: Path) -> Path | None:
+    """Walk up from a resolved directory looking for freespec.yaml.
+
+    Args:
+        current: Resolved starting directory.
+
+    Returns:
+        Path to freespec.yaml, or None if there is none up to the root.
+    """
     while current != current.parent:
         config_path = current / "freespec.yaml"
         if config_path.exists():
@@ -214,4 +280,10 @@ def find_config(start_path: Path | str | None = None) -> Path:
     if config_path.exists():
         return config_path
 
-    raise ConfigError(f"No freespec.yaml found in {start_path} or any parent directory")
+    return None
+
+
+def clear_config_cache() -> None:
+    """Forget cached config lookups and parsed config files."""
+    _find_config_from.cache_clear()
+    _read_config_data.cache_clear()
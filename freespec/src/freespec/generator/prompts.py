@@ -108,8 +108,10 @@ class PromptBuilder:
                     "",
                     "## Requirements:",
                     "- Each export becomes a function or method that can be imported and called",
-                    "- For entities: Create a dataclass with fields and methods from exports",
-                    "- For services: Create a class with method signatures matching exports ONLY",
+                    "- For entities: Use @dataclass(slots=True) with fields and exported methods",
+                    "- For services: Create a class with method signatures matching exports ONLY;",
+                    "  result types it returns (e.g., a schedule) use @dataclass(slots=True)",
+                    "- For APIs: Request/response dataclasses use @dataclass(slots=True)",
                     "- All methods must raise NotImplementedError() - NO real implementation",
                     "- Include complete type hints for all parameters and return types",
                     "- Do NOT import from other generated modules (standalone interface)",
@@ -372,11 +374,17 @@ class PromptBuilder:
             "",
             "## Instructions",
             "",
-            "1. Create a test function for each item in the 'tests:' section.",
+            "1. Create a test function for each item in the 'tests:' section, defined at",
+            "   module level rather than grouped in test classes.",
             "2. Name test functions descriptively based on the test description.",
-            "3. Mark each test as skipped/pending (e.g., @pytest.mark.skip in Python).",
-            "4. Include a comment in each test explaining what it should verify.",
-            "5. Write the file to the specified output path.",
+            "3. Mark the tests as skipped/pending once for the whole file, not per test,",
+            '   always with the reason "Not implemented" (e.g., a module-level',
+            '   `pytestmark = pytest.mark.skip(reason="Not implemented")` in Python).',
+            "4. Do not import the code under test at all; skeleton bodies do not use it.",
+            "   Import only names the file actually references; no unused imports.",
+            "5. Keep each test body to a single `pass` (or equivalent) with no docstring or",
+            "   comments; the descriptive name and the spec already say what it verifies.",
+            "6. Write the file to the specified output path.",
         ]
 
         return "\n".join(prompt_parts)
@@ -527,6 +535,7 @@ class PromptBuilder:
                 "- ONLY mock external services (DB, network, filesystem)",
                 f"- Tests must PASS - {lang_info['no_skip_instruction']}",
                 "- Test the behavior described in the spec's tests section",
+                f"- {lang_info['test_setup']}",
                 "",
                 "**Why no mocking dependencies?** If you use a field that doesn't exist",
                 "on a dependency, the test will fail with AttributeError. This catches bugs.",
@@ -681,6 +690,11 @@ class PromptBuilder:
                     "Use Catch2 (single-header) for testing. "
                     "Include catch.hpp and use TEST_CASE/REQUIRE macros"
                 ),
+                "test_setup": (
+                    "Share repository and service setup through SECTIONs in one TEST_CASE "
+                    "instead of repeating it; each SECTION reruns the setup, so every check "
+                    "starts from fresh state"
+                ),
                 "no_skip_instruction": "no SKIP or disabled tests",
                 "header_ext": ".hpp",
                 "impl_ext": ".cpp",
@@ -694,11 +708,19 @@ class PromptBuilder:
                     "mock ONLY external dependencies (DB, network) using unittest.mock"
                 ),
                 "example_function": "`create_student()` or `Student.create()`",
-                "impl_requirements": "Use proper type hints throughout",
+                "impl_requirements": (
+                    "Use proper type hints throughout. Serialize response dataclasses "
+                    "with explicit dict literals, never dataclasses.asdict"
+                ),
                 "test_requirements": (
                     "Import directly from the implementation file "
                     "(e.g., from src.entities.student import Student)"
                 ),
+                "test_setup": (
+                    "Build repositories and services in shared pytest fixtures instead of "
+                    "repeating the setup in every test; keep fixtures that hold mutable "
+                    "state function-scoped so every test starts fresh"
+                ),
                 "no_skip_instruction": "no @pytest.mark.skip or pending markers",
                 "header_ext": ".py",
                 "impl_ext": ".py",
@@ -932,7 +954,8 @@ Generate Python stub files with:
 - Function/method signatures with complete type hints
 - Classes with all fields and method signatures
 - All methods raise NotImplementedError()
-- Dataclasses for entities with fields and types
+- Dataclasses for entities, service result types and API request/response
+  types, declared with @dataclass(slots=True)
 - Complete enum definitions
 - Docstrings for every function and class
 - Standard library types only (datetime, uuid, typing, etc.)
@@ -954,7 +977,7 @@ exports:
 
 Generate ONLY:
 ```python
-@dataclass
+@dataclass(slots=True)
 class Student:
     name: str
     email: str
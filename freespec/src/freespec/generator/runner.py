@@ -92,7 +92,16 @@ class PytestRunner:
 
         try:
             result = subprocess.run(
-                ["python", "-m", "pytest", str(test_path), "-v", "--tb=short"],
+                [
+                    "python",
+                    "-m",
+                    "pytest",
+                    str(test_path),
+                    "-v",
+                    "--tb=short",
+                    "-p",
+                    "no:cacheprovider",
+                ],
                 capture_output=True,
                 text=True,
                 timeout=self.timeout,
@@ -7,6 +7,7 @@ implementations (for standard workflow).
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -122,6 +123,7 @@ class SkeletonTestGenerator:
         config: FreeSpecConfig,
         source_code: dict[str, str],
         language: str,
+        num_workers: int = 1,
     ) -> SkeletonTestContext:
         """Generate tests for all specs.
 
@@ -130,6 +132,7 @@ class SkeletonTestGenerator:
             config: Project configuration.
             source_code: Map of spec_id to header or implementation code.
             language: Target language (python, cpp).
+            num_workers: Number of parallel workers (1 = sequential).
 
         Returns:
             Context with all generated tests.
@@ -139,14 +142,67 @@ class SkeletonTestGenerator:
         """
         context = SkeletonTestContext(config=config)
 
-        for spec in specs:
+        if num_workers > 1 and len(specs) > 1:
+            self._generate_tests_parallel(specs, context, source_code, language, num_workers)
+        else:
+            for spec in specs:
+                code = source_code.get(spec.spec_id, "")
+                test = self.generate_test(spec, config, code, language)
+                if test:
+                    context.generated_files.append(test)
+
+        return context
+
+    def _generate_tests_parallel(
+        self,
+        specs: list[SpecFile],
+        context: SkeletonTestContext,
+        source_code: dict[str, str],
+        language: str,
+        num_workers: int,
+    ) -> None:
+        """Generate tests in parallel using ThreadPoolExecutor.
+
+        Generated files are recorded in spec order regardless of which
+        finishes first.
+
+        Args:
+            specs: Specs to generate tests for.
+            context: Test context to populate.
+            source_code: Map of spec_id to header or implementation code.
+            language: Target language.
+            num_workers: Number of parallel workers.
+
+        Raises:
+            SkeletonGenError: If any generation fails.
+        """
+        results: dict[str, GeneratedTest | None] = {}
+        first_error: SkeletonGenError | None = None
+
+        def process_spec(spec: SpecFile) -> GeneratedTest | None:
             code = source_code.get(spec.spec_id, "")
-            test = self.generate_test(spec, config, code, language)
+            return self.generate_test(spec, context.config, code, language)
+
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            future_to_spec = {executor.submit(process_spec, spec): spec for spec in specs}
+
+            for future in as_completed(future_to_spec):
+                spec = future_to_spec[future]
+                try:
+                    results[spec.spec_id] = future.result()
+                except SkeletonGenError as e:
+                    if first_error is None:
+                        first_error = e
+                    logger.error("Failed to generate tests for %s: %s", spec.spec_id, e)
+
+        if first_error is not None:
+            raise first_error
+
+        for spec in specs:
+            test = results.get(spec.spec_id)
             if test:
                 context.generated_files.append(test)
 
-        return context
-
     def _get_test_path(self, spec: SpecFile, config: FreeSpecConfig, language: str) -> Path:
         """Determine output path for a spec's test file.
 
@@ -2,6 +2,14 @@
 
 from freespec.parser.dependency import DependencyResolver
 from freespec.parser.models import DependencyGraph, Section, SpecFile
+from freespec.parser.spec_cache import SpecCache
 from freespec.parser.spec_parser import SpecParser
 
-__all__ = ["DependencyGraph", "DependencyResolver", "Section", "SpecFile", "SpecParser"]
+__all__ = [
+    "DependencyGraph",
+    "DependencyResolver",
+    "Section",
+    "SpecCache",
+    "SpecFile",
+    "SpecParser",
+]
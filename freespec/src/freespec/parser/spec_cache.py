@@ -0,0 +1,222 @@
+"""Persistent cache of parsed spec files.
+
+Every CLI command parses all spec files, although most runs only change a
+few of them. The cache stores each parsed SpecFile together with the file's
+modification time and size, so an unchanged file costs one stat() instead of
+a read and a parse. When the stat no longer matches, a hash of the file's
+contents decides whether it really changed, so files that were only touched
+(checkouts, copies, editors saving without edits) are not reparsed.
+
+The cache is plain JSON and every entry is re-validated on load, since it
+lives in the project's output directory.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from freespec import __version__
+from freespec.parser import models, spec_parser
+from freespec.parser.models import Section, SpecFile
+from freespec.parser.spec_parser import SpecParser
+
+logger = logging.getLogger("freespec.parser.spec_cache")
+
+
+class SpecCache:
+    """Parsed specs keyed by absolute path, validated by mtime, size and content hash."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            path: File the cache is loaded from and saved to.
+        """
+        self.path = path
+        self._entries: dict[str, tuple[int, int, str, SpecFile]] = {}
+        self._seen: set[str] = set()
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Path) -> SpecCache:
+        """Load a cache from disk.
+
+        Args:
+            path: Path to the cache file.
+
+        Returns:
+            The loaded cache, or an empty one if the file is missing,
+            unreadable, or written by a different parser. Malformed entries
+            are dropped.
+        """
+        cache = cls(path)
+        if not path.exists():
+            return cache
+
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            logger.debug("Ignoring unreadable spec cache at %s", path)
+            return cache
+
+        if not isinstance(data, dict) or data.get("key") != _cache_key():
+            return cache
+
+        entries = data.get("entries")
+        if isinstance(entries, dict):
+            for key, entry in entries.items():
+                parsed = _entry_from_dict(entry)
+                if parsed is not None:
+                    cache._entries[key] = parsed
+        return cache
+
+    def save(self) -> None:
+        """Save the cache if anything changed.
+
+        Only entries for files looked up since loading are kept, so specs
+        that were deleted or moved drop out of the cache. Saving is best
+        effort: a cache that cannot be written is logged and skipped.
+        """
+        if not self._dirty and self._seen == self._entries.keys():
+            return
+
+        entries = {key: entry for key, entry in self._entries.items() if key in self._seen}
+        data = {
+            "key": _cache_key(),
+            "entries": {key: _entry_to_dict(*entry) for key, entry in entries.items()},
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump(data, f)
+        except OSError as e:
+            logger.debug("Could not write spec cache to %s: %s", self.path, e)
+            return
+        self._entries = entries
+        self._dirty = False
+
+    def parse_file(self, parser: SpecParser, path: Path) -> SpecFile:
+        """Return the parsed spec for a file, parsing only on a cache miss.
+
+        Args:
+            parser: Parser used when the file is new or has changed.
+            path: Path to the .spec file.
+
+        Returns:
+            Parsed SpecFile object.
+
+        Raises:
+            ParseError: If the file has to be parsed and is invalid.
+        """
+        key = os.path.abspath(path)
+        self._seen.add(key)
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return parser.parse_file(path)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return _with_path(entry[3], path)
+
+        try:
+            digest = _content_hash(path)
+        except OSError:
+            return parser.parse_file(path)
+
+        self._dirty = True
+        if entry is not None and entry[2] == digest:
+            self._entries[key] = (stat.st_mtime_ns, stat.st_size, digest, entry[3])
+            return _with_path(entry[3], path)
+
+        spec = parser.parse_file(path)
+        self._entries[key] = (stat.st_mtime_ns, stat.st_size, digest, spec)
+        return spec
+
+
+@functools.cache
+def _cache_key() -> str:
+    """Identify the parser that produced a cache.
+
+    Combines the freespec version with the parser and model sources, so any
+    change to how specs are parsed or represented invalidates the cache.
+    """
+    h = hashlib.blake2b(__version__.encode(), digest_size=16)
+    for module in (spec_parser, models):
+        try:
+            h.update(Path(module.__file__).read_bytes())
+        except (OSError, TypeError):
+            pass
+    return h.hexdigest()
+
+
+def _content_hash(path: Path) -> str:
+    """Hash a file's contents for change detection."""
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def _with_path(spec: SpecFile, path: Path) -> SpecFile:
+    """Return a cached spec carrying the path it was looked up by."""
+    return spec if spec.path == path else dataclasses.replace(spec, path=path)
+
+
+def _entry_to_dict(mtime_ns: int, size: int, digest: str, spec: SpecFile) -> dict[str, Any]:
+    """Convert a cache entry to JSON-compatible data."""
+    return {
+        "mtime_ns": mtime_ns,
+        "size": size,
+        "hash": digest,
+        "name": spec.name,
+        "category": spec.category,
+        "description": spec.description.content,
+        "exports": spec.exports.content,
+        "tests": spec.tests.content,
+        "mentions": spec.mentions,
+        "path": str(spec.path),
+    }
+
+
+def _entry_from_dict(data: Any) -> tuple[int, int, str, SpecFile] | None:
+    """Rebuild a cache entry from JSON data.
+
+    Returns:
+        The entry, or None if any field is missing or has the wrong type.
+    """
+    if not isinstance(data, dict):
+        return None
+
+    ints = [data.get(name) for name in ("mtime_ns", "size")]
+    strs = [
+        data.get(name)
+        for name in ("hash", "name", "category", "description", "exports", "tests", "path")
+    ]
+    mentions = data.get("mentions")
+    if not all(isinstance(v, int) and not isinstance(v, bool) for v in ints):
+        return None
+    if not all(isinstance(v, str) for v in strs):
+        return None
+    if not isinstance(mentions, list) or not all(isinstance(m, str) for m in mentions):
+        return None
+
+    mtime_ns, size = ints
+    digest, name, category, description, exports, tests, path = strs
+    spec = SpecFile(
+        path=Path(path),
+        name=name,
+        category=category,
+        description=Section(name="description", content=description),
+        exports=Section(name="exports", content=exports),
+        tests=Section(name="tests", content=tests),
+        mentions=mentions,
+    )
+    return mtime_ns, size, digest, spec
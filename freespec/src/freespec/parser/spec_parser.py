@@ -84,6 +84,18 @@ class SpecParser:
         Raises:
             ParseError: If any spec file is invalid.
         """
+        return [self.parse_file(path) for path in self.find_files(pattern, base_path)]
+
+    def find_files(self, pattern: str, base_path: Path | str | None = None) -> list[Path]:
+        """Find spec file paths matching a glob pattern without parsing them.
+
+        Args:
+            pattern: Glob pattern (e.g., '**/*.spec').
+            base_path: Base directory for the pattern. Defaults to current directory.
+
+        Returns:
+            Sorted list of matching paths.
+        """
         if base_path is None:
             base_path = Path.cwd()
         else:
@@ -93,12 +105,7 @@ class SpecParser:
         full_pattern = str(base_path / pattern)
         paths = glob.glob(full_pattern, recursive=True)
 
-        specs = []
-        for path_str in sorted(paths):
-            path = Path(path_str)
-            specs.append(self.parse_file(path))
-
-        return specs
+        return [Path(path_str) for path_str in sorted(paths)]
 
     def _parse_sections(self, content: str, path: Path) -> dict[str, Section]:
         """Parse content into sections.
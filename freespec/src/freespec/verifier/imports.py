@@ -6,6 +6,7 @@ import ast
 import logging
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -133,25 +134,36 @@ except Exception as e:
         self,
         files: list[Path],
         python_path: Path | None = None,
+        num_workers: int = 1,
     ) -> VerificationResult:
         """Verify all generated files can be imported.
 
+        Each import check runs in its own subprocess, so with more than one
+        worker the checks run concurrently on a thread pool.
+
         Args:
             files: List of Python files to verify.
             python_path: Additional path for PYTHONPATH.
+            num_workers: Maximum number of import checks to run at once.
 
         Returns:
-            Verification result with any errors found.
+            Verification result with any errors found, in file order.
         """
-        all_errors = []
-
-        for file_path in files:
-            if file_path.suffix != ".py":
-                continue
+        py_files = [file_path for file_path in files if file_path.suffix == ".py"]
 
+        def verify(file_path: Path) -> list[ImportError]:
             logger.debug("Verifying imports for %s", file_path)
-            errors = self.verify_import(file_path, python_path)
-            all_errors.extend(errors)
+            return self.verify_import(file_path, python_path)
+
+        all_errors = []
+
+        if num_workers > 1 and len(py_files) > 1:
+            with ThreadPoolExecutor(max_workers=min(num_workers, len(py_files))) as executor:
+                for errors in executor.map(verify, py_files):
+                    all_errors.extend(errors)
+        else:
+            for file_path in py_files:
+                all_errors.extend(verify(file_path))
 
         return VerificationResult(
             success=len(all_errors) == 0,
@@ -162,6 +174,7 @@ except Exception as e:
         self,
         files: list[Path],
         base_path: Path,
+        num_workers: int = 1,
     ) -> VerificationResult:
         """Verify files can import each other correctly.
 
@@ -170,6 +183,7 @@ except Exception as e:
         Args:
             files: List of Python files to verify.
             base_path: Base path for import resolution.
+            num_workers: Maximum number of import checks to run at once.
 
         Returns:
             Verification result with any errors found.
@@ -180,7 +194,7 @@ except Exception as e:
         self._ensure_init_files(files, base_path)
 
         # Verify each file can be imported
-        result = self.verify_all(files, python_path=base_path)
+        result = self.verify_all(files, python_path=base_path, num_workers=num_workers)
         all_errors.extend(result.errors)
 
         return VerificationResult(
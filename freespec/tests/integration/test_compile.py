@@ -301,3 +301,18 @@ class TestImportVerification:
 
         assert result.success
         assert len(result.errors) == 0
+
+    def test_verify_all_parallel_keeps_file_order(self, tmp_path: Path) -> None:
+        """Test concurrent verification reports errors in file order."""
+        files = []
+        for name in ["bad1", "good", "bad2"]:
+            path = tmp_path / f"{name}.py"
+            body = "x = 1\n" if name == "good" else f"import missing_{name}\n"
+            path.write_text(body)
+            files.append(path)
+
+        verifier = ImportVerifier()
+        result = verifier.verify_all(files, num_workers=3)
+
+        assert not result.success
+        assert [e.file_path for e in result.errors] == [files[0], files[2]]
@@ -0,0 +1,304 @@
+"""Unit tests for CLI helpers."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from click.testing import CliRunner
+
+from freespec.cli import (
+    _generate_and_load_headers,
+    _load_implementations,
+    _parse_all_specs,
+    _parse_spec_patterns,
+    _report_rebuild_plan,
+)
+from freespec.cli import compile as compile_command
+from freespec.config import FreeSpecConfig
+from freespec.generator.headers import HeaderContext
+from freespec.generator.runner import PytestRunner, RunnerError
+from freespec.llm.claude_code import ClaudeCodeClient
+from freespec.parser.spec_parser import ParseError, SpecParser
+from freespec.rebuild.detector import DetectionResult, RebuildInfo, RebuildReason
+
+SPEC_CONTENT = "description:\nA {name}.\n\nexports:\n- Create {name}\n\ntests:\n- Test {name}\n"
+
+
+def write_spec(root: Path, category: str, name: str) -> Path:
+    """Helper to write a minimal valid spec file."""
+    path = root / category / f"{name}.spec"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(SPEC_CONTENT.format(name=name))
+    return path
+
+
+def make_config(tmp_path: Path, specs: list[str]) -> FreeSpecConfig:
+    """Helper to create a FreeSpecConfig rooted at tmp_path."""
+    return FreeSpecConfig(name="test-project", version="1.0", specs=specs, root_path=tmp_path)
+
+
+class TestParseAllSpecs:
+    """Tests for parsing all configured spec patterns."""
+
+    def test_keeps_pattern_and_file_order(self, tmp_path: Path) -> None:
+        """Should return specs grouped by pattern in configuration order."""
+        write_spec(tmp_path, "services", "enrollment")
+        write_spec(tmp_path, "entities", "student")
+        write_spec(tmp_path, "entities", "course")
+        config = make_config(tmp_path, ["services/*.spec", "entities/*.spec"])
+
+        specs = _parse_all_specs(SpecParser(), config)
+
+        assert [s.spec_id for s in specs] == [
+            "services/enrollment",
+            "entities/course",
+            "entities/student",
+        ]
+
+    def test_reports_specs_per_pattern(self, tmp_path: Path) -> None:
+        """Should pair each pattern with the specs it matched."""
+        write_spec(tmp_path, "entities", "student")
+        config = make_config(tmp_path, ["entities/*.spec", "api/*.spec"])
+
+        result = _parse_spec_patterns(SpecParser(), config)
+
+        assert [(pattern, len(parsed)) for pattern, parsed in result] == [
+            ("entities/*.spec", 1),
+            ("api/*.spec", 0),
+        ]
+
+    def test_saves_cache_only_when_asked(self, tmp_path: Path) -> None:
+        """Should leave the output directory alone unless saving the cache."""
+        write_spec(tmp_path, "entities", "student")
+        config = make_config(tmp_path, ["entities/*.spec"])
+
+        _parse_all_specs(SpecParser(), config)
+        assert not config.get_spec_cache_path().exists()
+
+        _parse_all_specs(SpecParser(), config, save_cache=True)
+        assert config.get_spec_cache_path().exists()
+
+    def test_propagates_parse_errors(self, tmp_path: Path) -> None:
+        """Should raise ParseError when any spec is invalid."""
+        write_spec(tmp_path, "entities", "student")
+        (tmp_path / "entities" / "broken.spec").write_text("description:\nNo other sections\n")
+        config = make_config(tmp_path, ["entities/*.spec"])
+
+        with pytest.raises(ParseError):
+            _parse_all_specs(SpecParser(), config)
+
+
+class TestLoadImplementations:
+    """Tests for loading existing implementation files."""
+
+    def test_loads_by_spec_id(self, tmp_path: Path) -> None:
+        """Should map each implementation file to its spec ID."""
+        config = make_config(tmp_path, ["**/*.spec"])
+        src_dir = config.get_src_path("python")
+        (src_dir / "entities").mkdir(parents=True)
+        (src_dir / "entities" / "student.py").write_text("class Student: ...")
+        (src_dir / "entities" / "course.py").write_text("class Course: ...")
+
+        impls = _load_implementations(config, "python")
+
+        assert impls == {
+            "entities/student": "class Student: ...",
+            "entities/course": "class Course: ...",
+        }
+
+    def test_skips_init_and_test_files(self, tmp_path: Path) -> None:
+        """Should ignore package markers and test modules."""
+        config = make_config(tmp_path, ["**/*.spec"])
+        src_dir = config.get_src_path("python")
+        (src_dir / "entities").mkdir(parents=True)
+        (src_dir / "entities" / "__init__.py").write_text("")
+        (src_dir / "entities" / "test_student.py").write_text("def test(): pass")
+
+        assert _load_implementations(config, "python") == {}
+
+    def test_loads_cpp_sources(self, tmp_path: Path) -> None:
+        """Should pick the file extension from the language."""
+        config = make_config(tmp_path, ["**/*.spec"])
+        src_dir = config.get_src_path("cpp")
+        (src_dir / "entities").mkdir(parents=True)
+        (src_dir / "entities" / "student.cpp").write_text("struct Student {};")
+        (src_dir / "entities" / "student.hpp").write_text("struct Student;")
+
+        assert _load_implementations(config, "cpp") == {"entities/student": "struct Student {};"}
+
+    def test_loads_nested_and_top_level_files(self, tmp_path: Path) -> None:
+        """Should key nested files by their directory and top-level files by name."""
+        config = make_config(tmp_path, ["**/*.spec"])
+        src_dir = config.get_src_path("python")
+        (src_dir / "api" / "v1").mkdir(parents=True)
+        (src_dir / "api" / "v1" / "courses.py").write_text("router = None")
+        (src_dir / "main.py").write_text("app = None")
+
+        impls = _load_implementations(config, "python")
+
+        assert impls == {"v1/courses": "router = None", "main": "app = None"}
+
+    def test_missing_src_dir(self, tmp_path: Path) -> None:
+        """Should return an empty map when nothing has been generated."""
+        config = make_config(tmp_path, ["**/*.spec"])
+
+        assert _load_implementations(config, "python") == {}
+
+
+class TestGenerateAndLoadHeaders:
+    """Tests for generating headers and loading the rest from disk."""
+
+    def test_merges_existing_and_generated_headers(self, tmp_path: Path) -> None:
+        """Should return headers from disk together with the generated ones."""
+        config = make_config(tmp_path, ["**/*.spec"])
+        src_dir = config.get_src_path("python")
+        (src_dir / "entities").mkdir(parents=True)
+        (src_dir / "entities" / "course.py").write_text("class Course: ...")
+
+        def generate(specs, config, language, detector=None, num_workers=1):
+            (src_dir / "entities" / "student.py").write_text("class Student: ...")
+            return HeaderContext(config=config, headers={"entities/student": "class Student: ..."})
+
+        generator = MagicMock()
+        generator.generate_all_headers.side_effect = generate
+
+        context, headers = _generate_and_load_headers(generator, [], config, "python", None, 1)
+
+        assert context.headers == {"entities/student": "class Student: ..."}
+        assert headers == {
+            "entities/course": "class Course: ...",
+            "entities/student": "class Student: ...",
+        }
+
+    def test_generated_headers_win(self, tmp_path: Path) -> None:
+        """Should prefer generated headers over the copies read from disk."""
+        config = make_config(tmp_path, ["**/*.spec"])
+        src_dir = config.get_src_path("python")
+        (src_dir / "entities").mkdir(parents=True)
+        (src_dir / "entities" / "student.py").write_text("stale")
+
+        generator = MagicMock()
+        generator.generate_all_headers.return_value = HeaderContext(
+            config=config, headers={"entities/student": "fresh"}
+        )
+
+        _, headers = _generate_and_load_headers(generator, [], config, "python", None, 1)
+
+        assert headers == {"entities/student": "fresh"}
+
+
+class TestReportRebuildPlan:
+    """Tests for the rebuild plan report."""
+
+    def make_detection(self) -> DetectionResult:
+        """Helper to create a detection result with two rebuilds."""
+        return DetectionResult(
+            rebuild_info={
+                "entities/student": RebuildInfo(
+                    spec_id="entities/student",
+                    needs_header=True,
+                    needs_impl=True,
+                    reasons=[RebuildReason.SPEC_CHANGED],
+                ),
+                "services/enrollment": RebuildInfo(
+                    spec_id="services/enrollment",
+                    needs_impl=True,
+                    reasons=[RebuildReason.DEPENDENCY_HEADER_CHANGED],
+                    triggering_deps=["entities/student"],
+                ),
+            },
+            header_specs=["entities/student"],
+            impl_specs=["entities/student", "services/enrollment"],
+            total_specs=5,
+        )
+
+    def test_reports_each_spec(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Should list every spec with its reasons and action."""
+        _report_rebuild_plan(self.make_detection(), verbose=False)
+
+        assert capsys.readouterr().out.splitlines() == [
+            "  Would rebuild 2 of 5 specs:",
+            "    entities/student (spec changed -> header + impl)",
+            "    services/enrollment (dependency header changed -> impl)",
+        ]
+
+    def test_header_only_action(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Should report a header-only rebuild as such."""
+        detection = DetectionResult(
+            rebuild_info={
+                "entities/course": RebuildInfo(
+                    spec_id="entities/course",
+                    needs_header=True,
+                    reasons=[RebuildReason.HEADER_CHANGED],
+                ),
+            },
+            header_specs=["entities/course"],
+            impl_specs=["entities/course"],
+            total_specs=1,
+        )
+
+        _report_rebuild_plan(detection, verbose=False)
+
+        assert "    entities/course (header changed -> header)" in capsys.readouterr().out
+
+    def test_verbose_reports_triggering_deps(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Should add the triggering dependencies in verbose mode."""
+        _report_rebuild_plan(self.make_detection(), verbose=True)
+
+        assert "      Triggered by: entities/student" in capsys.readouterr().out.splitlines()
+
+    def test_nothing_to_rebuild(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Should say so when no spec needs rebuilding."""
+        detection = DetectionResult(rebuild_info={}, header_specs=[], impl_specs=[], total_specs=3)
+
+        _report_rebuild_plan(detection, verbose=False)
+
+        assert capsys.readouterr().out == "  Nothing to rebuild\n"
+
+
+def write_project(root: Path, specs: str) -> Path:
+    """Helper to write a freespec.yaml with one spec pattern."""
+    config_path = root / "freespec.yaml"
+    config_path.write_text(f'name: test-project\nversion: "1.0"\nspecs:\n  - "{specs}"\n')
+    return config_path
+
+
+class TestCompileCommand:
+    """Tests for the compile command up to code generation."""
+
+    def test_file_matches_spec_through_symlink(self, tmp_path: Path) -> None:
+        """Should match --file by resolved path when specs are found through a symlink."""
+        real = tmp_path / "real"
+        spec_path = write_spec(real, "entities", "student")
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / "linked").symlink_to(real, target_is_directory=True)
+        config_path = write_project(project, "linked/entities/*.spec")
+
+        result = CliRunner().invoke(
+            compile_command, ["-c", str(config_path), "--file", str(spec_path), "--dry-run"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Filtering to single file: student.spec" in result.output
+
+    def test_exits_when_test_runner_unavailable(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should report the runner error and exit 1 before generating anything."""
+        write_spec(tmp_path, "entities", "student")
+        config_path = write_project(tmp_path, "entities/*.spec")
+
+        def runner_unavailable(self: PytestRunner) -> bool:
+            raise RunnerError("pytest not found")
+
+        monkeypatch.setattr(ClaudeCodeClient, "check_available", lambda self: True)
+        monkeypatch.setattr(PytestRunner, "check_available", runner_unavailable)
+
+        result = CliRunner().invoke(
+            compile_command, ["-c", str(config_path), "--log-dir", str(tmp_path / "logs")]
+        )
+
+        assert result.exit_code == 1
+        assert "Error: pytest not found" in result.output
+        assert not (tmp_path / "out" / "python" / "src").exists()
@@ -7,6 +7,7 @@ import pytest
 
 from freespec.config import (
     ConfigError,
+    clear_config_cache,
     find_config,
     load_config,
 )
@@ -79,6 +80,22 @@ class TestLoadConfig:
         with pytest.raises(ConfigError, match="Invalid YAML"):
             load_config(config_path)
 
+    def test_invalid_yaml_error_names_given_path(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        (tmp_path / "freespec.yaml").write_text("invalid: yaml: content:")
+        monkeypatch.chdir(tmp_path)
+
+        with pytest.raises(ConfigError, match=r"Invalid YAML in freespec\.yaml:"):
+            load_config("freespec.yaml")
+
+    def test_load_rejects_specs_string(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "freespec.yaml"
+        config_path.write_text('name: test\nversion: "1.0"\nspecs: "x/*.spec"\n')
+
+        with pytest.raises(ConfigError, match="'specs' must be a list"):
+            load_config(config_path)
+
     def test_load_defaults_for_optional_fields(self, tmp_path: Path) -> None:
         config_path = tmp_path / "freespec.yaml"
         config_path.write_text(
@@ -96,6 +113,24 @@ class TestLoadConfig:
         assert config.output.out == "out/"
         assert config.settings.interactive is True
 
+    def test_load_twice_returns_independent_configs(self, temp_config: Path) -> None:
+        first = load_config(temp_config)
+        first.specs.append("extra/*.spec")
+
+        second = load_config(temp_config)
+
+        assert second is not first
+        assert second.specs == ["**/*.spec"]
+
+    def test_load_sees_edited_file(self, temp_config: Path) -> None:
+        load_config(temp_config)
+        temp_config.write_text("name: renamed-project\nversion: '2.0'\nspecs: []\n")
+
+        config = load_config(temp_config)
+
+        assert config.name == "renamed-project"
+        assert config.version == "2.0"
+
 
 class TestFreeSpecConfig:
     """Tests for FreeSpecConfig."""
@@ -142,6 +177,13 @@ class TestFreeSpecConfig:
 
         assert manifest_path == config.root_path / "out" / "python" / ".freespec_build.json"
 
+    def test_get_spec_cache_path(self, temp_config: Path) -> None:
+        config = load_config(temp_config)
+
+        cache_path = config.get_spec_cache_path()
+
+        assert cache_path == config.root_path / "out" / ".freespec_specs.json"
+
 
 class TestFindConfig:
     """Tests for find_config function."""
@@ -171,3 +213,32 @@ class TestFindConfig:
 
         with pytest.raises(ConfigError, match="No freespec.yaml found"):
             find_config(subdir)
+
+    def test_find_after_config_created(self, tmp_path: Path) -> None:
+        with pytest.raises(ConfigError):
+            find_config(tmp_path)
+
+        config_path = tmp_path / "freespec.yaml"
+        config_path.write_text("name: test\nversion: '1.0'\nspecs: []")
+
+        assert find_config(tmp_path) == config_path
+
+    def test_find_after_config_removed(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "sub" / "freespec.yaml"
+        config_path.parent.mkdir()
+        config_path.write_text("name: test\nversion: '1.0'\nspecs: []")
+        parent_config = tmp_path / "freespec.yaml"
+        parent_config.write_text("name: parent\nversion: '1.0'\nspecs: []")
+        assert find_config(config_path.parent) == config_path
+
+        config_path.unlink()
+
+        assert find_config(config_path.parent) == parent_config
+
+    def test_clear_config_cache(self, temp_config: Path) -> None:
+        find_config(temp_config.parent)
+        load_config(temp_config)
+
+        clear_config_cache()
+
+        assert find_config(temp_config.parent) == temp_config
@@ -16,6 +16,7 @@ from freespec.generator.impl import (
     ImplementationGenerator,
 )
 from freespec.generator.tests import (
+    SkeletonGenError,
     SkeletonTestGenerator,
 )
 from freespec.llm.claude_code import GenerationResult
@@ -317,6 +318,50 @@ class TestSkeletonTestGenerator:
         assert result is None
         mock_client.generate.assert_not_called()
 
+    def test_generate_all_tests_parallel(self, tmp_path: Path) -> None:
+        """Should generate tests for every spec with multiple workers, in spec order."""
+        config = make_config(tmp_path)
+        specs = [make_spec(name, "entities") for name in ["student", "course", "session"]]
+
+        mock_client = MagicMock()
+        mock_client.generate.return_value = GenerationResult(
+            success=True,
+            output="Generated tests",
+            error=None,
+        )
+
+        for spec in specs:
+            output_path = tmp_path / f"out/python/tests/entities/test_{spec.name}.py"
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_text(f"def test_{spec.name}(): pass\n")
+
+        generator = SkeletonTestGenerator(client=mock_client)
+        context = generator.generate_all_tests(specs, config, {}, TEST_LANGUAGE, num_workers=3)
+
+        assert [t.spec_id for t in context.generated_files] == [
+            "entities/student",
+            "entities/course",
+            "entities/session",
+        ]
+        assert mock_client.generate.call_count == 3
+
+    def test_generate_all_tests_parallel_raises_failure(self, tmp_path: Path) -> None:
+        """Should raise SkeletonGenError when a parallel generation fails."""
+        config = make_config(tmp_path)
+        specs = [make_spec(name, "entities") for name in ["student", "course"]]
+
+        mock_client = MagicMock()
+        mock_client.generate.return_value = GenerationResult(
+            success=False,
+            output="",
+            error="boom",
+        )
+
+        generator = SkeletonTestGenerator(client=mock_client)
+
+        with pytest.raises(SkeletonGenError, match="boom"):
+            generator.generate_all_tests(specs, config, {}, TEST_LANGUAGE, num_workers=2)
+
     def test_get_test_path(self, tmp_path: Path) -> None:
         """Should generate correct path for test files."""
         config = make_config(tmp_path)
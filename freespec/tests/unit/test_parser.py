@@ -221,3 +221,17 @@ class TestSpecParser:
         assert len(specs) == 2
         categories = {s.category for s in specs}
         assert categories == {"entities", "services"}
+
+    def test_find_files_sorted_without_parsing(self, parser: SpecParser, tmp_path: Path) -> None:
+        # Invalid contents prove the files are only listed, not parsed
+        for name in ["student", "course"]:
+            spec_path = tmp_path / "entities" / f"{name}.spec"
+            spec_path.parent.mkdir(parents=True, exist_ok=True)
+            spec_path.write_text("not a spec")
+
+        paths = parser.find_files("entities/*.spec", tmp_path)
+
+        assert paths == [
+            tmp_path / "entities" / "course.spec",
+            tmp_path / "entities" / "student.spec",
+        ]
@@ -84,6 +84,48 @@ class TestPromptBuilder:
         # Should explicitly forbid abstract classes
         assert "abstract" in prompt.lower()
 
+    def test_build_header_prompt_slotted_api_dataclasses(self, builder: PromptBuilder) -> None:
+        """Should ask for slotted request/response dataclasses in Python."""
+        spec = make_spec("courses", "api")
+
+        prompt = builder.build_header_prompt(
+            spec=spec,
+            language="python",
+            output_path=Path("/output/api/courses.py"),
+        )
+        instructions = builder.build_header_instructions_prompt("python")
+
+        assert "@dataclass(slots=True)" in prompt
+        assert "@dataclass(slots=True)" in instructions
+
+    def test_build_header_prompt_slotted_entities(self, builder: PromptBuilder) -> None:
+        """Should ask for slotted entity dataclasses in Python."""
+        spec = make_spec("student", "entities")
+
+        prompt = builder.build_header_prompt(
+            spec=spec,
+            language="python",
+            output_path=Path("/output/entities/student.py"),
+        )
+        instructions = builder.build_header_instructions_prompt("python")
+
+        assert "For entities: Use @dataclass(slots=True)" in prompt
+        assert "@dataclass(slots=True)\nclass Student:" in instructions
+
+    def test_build_header_prompt_slotted_service_results(self, builder: PromptBuilder) -> None:
+        """Should ask for slotted service result dataclasses in Python."""
+        spec = make_spec("enrollment", "services")
+
+        prompt = builder.build_header_prompt(
+            spec=spec,
+            language="python",
+            output_path=Path("/output/services/enrollment.py"),
+        )
+        instructions = builder.build_header_instructions_prompt("python")
+
+        assert "result types it returns (e.g., a schedule) use @dataclass(slots=True)" in prompt
+        assert "service result types" in instructions
+
     def test_build_impl_prompt_without_headers(self, builder: PromptBuilder) -> None:
         """Should build an implementation prompt without headers."""
         spec = make_spec("student", "entities")
@@ -144,6 +186,62 @@ class TestPromptBuilder:
         assert impl_code in prompt
         assert "pytest" in prompt.lower() or "skip" in prompt.lower()
 
+    def test_build_test_prompt_skips_module_once(self, builder: PromptBuilder) -> None:
+        """Should ask for one module-level skip instead of a marker per test."""
+        spec = make_spec("student", "entities")
+
+        prompt = builder.build_test_prompt(
+            spec=spec,
+            language="python",
+            output_path=Path("/output/tests/entities/test_student.py"),
+            impl_code="class Student: pass",
+        )
+
+        assert 'pytestmark = pytest.mark.skip(reason="Not implemented")' in prompt
+        assert "not per test" in prompt
+
+    def test_build_test_prompt_defers_imports(self, builder: PromptBuilder) -> None:
+        """Should keep the code under test out of skeleton imports entirely."""
+        spec = make_spec("student", "entities")
+
+        prompt = builder.build_test_prompt(
+            spec=spec,
+            language="python",
+            output_path=Path("/output/tests/entities/test_student.py"),
+            impl_code="class Student: pass",
+        )
+
+        assert "Do not import the code under test at all" in prompt
+        assert "TYPE_CHECKING" not in prompt
+        assert "no unused imports" in prompt
+
+    def test_build_test_prompt_bare_bodies(self, builder: PromptBuilder) -> None:
+        """Should ask for skeleton bodies without docstrings or comments."""
+        spec = make_spec("student", "entities")
+
+        prompt = builder.build_test_prompt(
+            spec=spec,
+            language="python",
+            output_path=Path("/output/tests/entities/test_student.py"),
+            impl_code="class Student: pass",
+        )
+
+        assert "no docstring or" in prompt
+        assert "Include a comment in each test" not in prompt
+
+    def test_build_test_prompt_module_level_functions(self, builder: PromptBuilder) -> None:
+        """Should ask for module-level test functions instead of test classes."""
+        spec = make_spec("student", "entities")
+
+        prompt = builder.build_test_prompt(
+            spec=spec,
+            language="python",
+            output_path=Path("/output/tests/entities/test_student.py"),
+            impl_code="class Student: pass",
+        )
+
+        assert "module level rather than grouped in test classes" in prompt
+
     def test_build_stub_prompt_deprecated(self, builder: PromptBuilder) -> None:
         """Should still work for backwards compatibility."""
         spec = make_spec("student", "entities")
@@ -265,6 +363,47 @@ class TestPromptBuilder:
         assert "mock" in prompt.lower()
         assert "external" in prompt.lower() or "DO NOT mock the module under test" in prompt
 
+    def test_build_compile_prompt_python_avoids_asdict(self, builder: PromptBuilder) -> None:
+        """Should steer Python serialization away from dataclasses.asdict."""
+        spec = make_spec("courses", "api")
+
+        prompt = builder.build_compile_prompt(
+            spec=spec,
+            language="python",
+            impl_path=Path("/output/src/api/courses.py"),
+            test_path=Path("/output/tests/api/test_courses.py"),
+        )
+
+        assert "never dataclasses.asdict" in prompt
+
+    def test_build_compile_prompt_python_test_fixtures(self, builder: PromptBuilder) -> None:
+        """Should ask for fixture-based setup with fresh mutable state per test."""
+        spec = make_spec("enrollment", "services")
+
+        prompt = builder.build_compile_prompt(
+            spec=spec,
+            language="python",
+            impl_path=Path("/output/src/services/enrollment.py"),
+            test_path=Path("/output/tests/services/test_enrollment.py"),
+        )
+
+        assert "pytest fixtures" in prompt
+        assert "function-scoped" in prompt
+
+    def test_build_compile_prompt_cpp_no_pytest_fixtures(self, builder: PromptBuilder) -> None:
+        """Should not ask C++ tests for pytest fixtures."""
+        spec = make_spec("enrollment", "services")
+
+        prompt = builder.build_compile_prompt(
+            spec=spec,
+            language="cpp",
+            impl_path=Path("/output/src/services/enrollment.cpp"),
+            test_path=Path("/output/tests/services/enrollment_test.cpp"),
+        )
+
+        assert "pytest" not in prompt
+        assert "SECTION" in prompt
+
     def test_build_review_prompt(self, builder: PromptBuilder) -> None:
         """Should build a review prompt with spec content and file paths."""
         spec = make_spec("student", "entities")
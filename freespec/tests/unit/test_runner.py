@@ -164,3 +164,17 @@ class TestPytestRunner:
         assert "pytest" in cmd
         assert str(test_file) in cmd
         assert "-v" in cmd
+
+    @patch("freespec.generator.runner.subprocess.run")
+    def test_run_test_disables_cache(self, mock_run: MagicMock, tmp_path: Path) -> None:
+        """Should not write .pytest_cache for generated test runs."""
+        test_file = tmp_path / "test_example.py"
+        test_file.write_text("def test_pass(): pass")
+
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        runner = PytestRunner(working_dir=tmp_path)
+        runner.run_test(test_file)
+
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("-p") + 1] == "no:cacheprovider"
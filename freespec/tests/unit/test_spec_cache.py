@@ -0,0 +1,177 @@
+"""Unit tests for the parsed spec cache."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from freespec.parser.spec_cache import SpecCache
+from freespec.parser.spec_parser import ParseError, SpecParser
+
+SPEC_CONTENT = "description:\nA {name}.\n\nexports:\n- Create {name}\n\ntests:\n- Test {name}\n"
+
+
+@pytest.fixture
+def spec_path(tmp_path: Path) -> Path:
+    """Create a spec file on disk."""
+    path = tmp_path / "entities" / "student.spec"
+    path.parent.mkdir(parents=True)
+    path.write_text(SPEC_CONTENT.format(name="student"))
+    return path
+
+
+def counting_parser() -> MagicMock:
+    """Create a parser mock that delegates to a real parser."""
+    parser = MagicMock(spec=SpecParser)
+    parser.parse_file.side_effect = SpecParser().parse_file
+    return parser
+
+
+class TestSpecCache:
+    """Tests for SpecCache."""
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path: Path, spec_path: Path) -> None:
+        cache_path = tmp_path / "cache.json"
+        cache = SpecCache.load(cache_path)
+        cache.parse_file(SpecParser(), spec_path)
+        cache.save()
+
+        parser = counting_parser()
+        spec = SpecCache.load(cache_path).parse_file(parser, spec_path)
+
+        assert spec.spec_id == "entities/student"
+        assert spec.path == spec_path
+        parser.parse_file.assert_not_called()
+
+    def test_changed_file_is_reparsed(self, tmp_path: Path, spec_path: Path) -> None:
+        cache_path = tmp_path / "cache.json"
+        cache = SpecCache.load(cache_path)
+        cache.parse_file(SpecParser(), spec_path)
+        cache.save()
+
+        spec_path.write_text(SPEC_CONTENT.format(name="learner"))
+        stat = spec_path.stat()
+        os.utime(spec_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        parser = counting_parser()
+        spec = SpecCache.load(cache_path).parse_file(parser, spec_path)
+
+        assert spec.exports.items == ["Create learner"]
+        parser.parse_file.assert_called_once()
+
+    def test_touched_but_unchanged_file_is_not_reparsed(
+        self, tmp_path: Path, spec_path: Path
+    ) -> None:
+        cache_path = tmp_path / "cache.json"
+        cache = SpecCache.load(cache_path)
+        cache.parse_file(SpecParser(), spec_path)
+        cache.save()
+
+        stat = spec_path.stat()
+        os.utime(spec_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        parser = counting_parser()
+        cache = SpecCache.load(cache_path)
+        spec = cache.parse_file(parser, spec_path)
+        cache.save()
+
+        assert spec.spec_id == "entities/student"
+        parser.parse_file.assert_not_called()
+
+        # The refreshed mtime is saved, so the next run hits on stat() alone.
+        entry = SpecCache.load(cache_path)._entries[os.path.abspath(spec_path)]
+        assert entry[0] == spec_path.stat().st_mtime_ns
+
+    def test_save_drops_files_not_seen(self, tmp_path: Path, spec_path: Path) -> None:
+        cache_path = tmp_path / "cache.json"
+        other = spec_path.with_name("course.spec")
+        other.write_text(SPEC_CONTENT.format(name="course"))
+        cache = SpecCache.load(cache_path)
+        cache.parse_file(SpecParser(), spec_path)
+        cache.parse_file(SpecParser(), other)
+        cache.save()
+
+        cache = SpecCache.load(cache_path)
+        cache.parse_file(SpecParser(), spec_path)
+        cache.save()
+
+        parser = counting_parser()
+        SpecCache.load(cache_path).parse_file(parser, other)
+        parser.parse_file.assert_called_once()
+
+    def test_invalid_spec_is_not_cached(self, tmp_path: Path) -> None:
+        broken = tmp_path / "broken.spec"
+        broken.write_text("description:\nNo other sections\n")
+        cache = SpecCache.load(tmp_path / "cache.json")
+
+        with pytest.raises(ParseError):
+            cache.parse_file(SpecParser(), broken)
+        with pytest.raises(ParseError):
+            cache.parse_file(SpecParser(), broken)
+
+    def test_corrupt_cache_file_is_ignored(self, tmp_path: Path, spec_path: Path) -> None:
+        cache_path = tmp_path / "cache.json"
+        cache_path.write_text("not json")
+
+        spec = SpecCache.load(cache_path).parse_file(SpecParser(), spec_path)
+
+        assert spec.spec_id == "entities/student"
+
+    def test_save_without_changes_does_not_write(self, tmp_path: Path) -> None:
+        cache_path = tmp_path / "cache.json"
+
+        SpecCache.load(cache_path).save()
+
+        assert not cache_path.exists()
+
+    def test_cache_is_plain_json(self, tmp_path: Path, spec_path: Path) -> None:
+        cache_path = tmp_path / "cache.json"
+        cache = SpecCache.load(cache_path)
+        cache.parse_file(SpecParser(), spec_path)
+        cache.save()
+
+        data = json.loads(cache_path.read_text())
+
+        entry = data["entries"][os.path.abspath(spec_path)]
+        assert entry["name"] == "student"
+        assert entry["category"] == "entities"
+
+    def test_cache_from_other_parser_is_ignored(self, tmp_path: Path, spec_path: Path) -> None:
+        cache_path = tmp_path / "cache.json"
+        cache = SpecCache.load(cache_path)
+        cache.parse_file(SpecParser(), spec_path)
+        cache.save()
+        data = json.loads(cache_path.read_text())
+        data["key"] = "other"
+        cache_path.write_text(json.dumps(data))
+
+        parser = counting_parser()
+        SpecCache.load(cache_path).parse_file(parser, spec_path)
+
+        parser.parse_file.assert_called_once()
+
+    def test_malformed_entry_is_dropped(self, tmp_path: Path, spec_path: Path) -> None:
+        cache_path = tmp_path / "cache.json"
+        cache = SpecCache.load(cache_path)
+        cache.parse_file(SpecParser(), spec_path)
+        cache.save()
+        data = json.loads(cache_path.read_text())
+        data["entries"][os.path.abspath(spec_path)]["mentions"] = "entities/course"
+        cache_path.write_text(json.dumps(data))
+
+        parser = counting_parser()
+        spec = SpecCache.load(cache_path).parse_file(parser, spec_path)
+
+        assert spec.mentions == []
+        parser.parse_file.assert_called_once()
+
+    def test_unwritable_cache_path_is_ignored(self, tmp_path: Path, spec_path: Path) -> None:
+        (tmp_path / "out").write_text("not a directory")
+        cache = SpecCache.load(tmp_path / "out" / "cache.json")
+        cache.parse_file(SpecParser(), spec_path)
+
+        cache.save()
+
+        assert (tmp_path / "out").read_text() == "not a directory"